@@ -0,0 +1,71 @@
+"""
+Compiled cache for agent/.env.
+
+The parsed .env values are written out as a Python module holding a dict
+literal, so later processes load them through the regular bytecode cache
+instead of parsing the file with python-dotenv again. The cache records the
+mtime of the .env file it was built from and is ignored once that changes.
+"""
+import os
+import importlib.util
+from typing import Optional
+
+CACHE_MODULE = "_env_cache"
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), CACHE_MODULE + ".py")
+
+
+def load_compiled_env(source_mtime_ns: int, cache_path: str = CACHE_PATH) -> Optional[dict[str, str]]:
+    """
+    Load values from the compiled cache.
+
+    Args:
+        source_mtime_ns: Current st_mtime_ns of the .env file
+        cache_path: Location of the compiled cache module
+
+    Returns:
+        The cached values, or None if the cache is missing or was built from
+        a different version of the .env file
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        spec = importlib.util.spec_from_file_location(CACHE_MODULE, cache_path)
+        if spec is None or spec.loader is None:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception:
+        return None  # Corrupt or partially written cache, rebuild it
+    if getattr(module, "SOURCE_MTIME_NS", None) != source_mtime_ns:
+        return None
+    return module.ENV
+
+
+def compile_env(values: dict[str, str], source_mtime_ns: int, cache_path: str = CACHE_PATH) -> bool:
+    """
+    Write values to the compiled cache.
+
+    The file holds secrets from .env, so it is created readable by the owner
+    only. Failures (e.g. a read-only deployment) are not fatal.
+
+    Returns:
+        True if the cache was written
+    """
+    source = (
+        "# Generated by _env_compiler.py from agent/.env - do not edit or commit\n"
+        f"SOURCE_MTIME_NS = {source_mtime_ns!r}\n"
+        f"ENV = {values!r}\n"
+    )
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(source)
+        os.replace(tmp_path, cache_path)
+        return True
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
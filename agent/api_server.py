@@ -47,6 +47,11 @@ except Exception as e:
 # Global dictionary to store agent processes
 processes: Dict[str, subprocess.Popen] = {}
 
+# Last agent status snapshot as (monotonic timestamp, response); the frontend
+# polls the status endpoint, so re-polling every child on each hit is wasted work
+STATUS_CACHE_TTL = 0.1  # seconds
+_status_cache: Optional[tuple[float, "AgentStatusResponse"]] = None
+
 # Audit storage file path
 AUDITS_STORAGE_FILE = Path(__file__).parent / "audits.json"
 
@@ -171,7 +176,9 @@ def start_agents(request: StartAgentsRequest):
     Raises:
         HTTPException: If any agent fails to start
     """
+    global _status_cache
     logger.info(f"Received request to start agents: targetAddress={request.targetAddress}, intensity={request.intensity}")
+    _status_cache = None
     
     # Check if agents are already running
     running_agents = [name for name, proc in processes.items() if proc and proc.poll() is None]
@@ -189,7 +196,7 @@ def start_agents(request: StartAgentsRequest):
         python_executable = str(venv_python)
         logger.info(f"Using venv Python: {python_executable}")
     else:
-    python_executable = sys.executable
+        python_executable = sys.executable
         logger.info(f"Using system Python: {python_executable}")
     
     # Get port configuration from config.py
@@ -329,6 +336,11 @@ def get_agents_status():
         AgentStatusResponse with boolean status for each agent (True if alive, False if not)
         and port information
     """
+    global _status_cache
+    now = time.monotonic()
+    if _status_cache is not None and now - _status_cache[0] < STATUS_CACHE_TTL:
+        return _status_cache[1]
+    
     logger.info("Checking agent status...")
     
     # Get port configuration from config.py
@@ -366,7 +378,9 @@ def get_agents_status():
             status[name] = False
     
     logger.info(f"Agent status: {status}")
-    return AgentStatusResponse(**status)
+    response = AgentStatusResponse(**status)
+    _status_cache = (now, response)
+    return response
 
 
 @app.post("/register", response_model=RegisterAgentResponse, tags=["Agents"])
@@ -799,6 +813,9 @@ def main():
         port=port,
         reload=False,  # Disable reload for production
         log_level="info",
+        # uvloop/httptools come with uvicorn[standard]; uvloop is unavailable on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
 
 
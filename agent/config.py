@@ -3,80 +3,157 @@ Configuration management for all 0xGuard agents.
 Loads environment variables from agent/.env file.
 """
 import os
-from pathlib import Path
-from dataclasses import dataclass
+import logging
+import functools
+import operator
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, ClassVar, Optional
 
-# Try to load dotenv from agent/.env file
-try:
-    from dotenv import load_dotenv
-    # Load from agent/.env file specifically
-    env_path = Path(__file__).parent / ".env"
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
-    else:
-        # Fallback to default dotenv behavior (current directory)
-        load_dotenv()
-except ImportError:
-    pass  # dotenv not available, continue without it
-
-# Load API keys with no defaults
-_ASI_API_KEY = os.getenv("ASI_API_KEY")
-_AGENTVERSE_KEY = os.getenv("AGENTVERSE_KEY")
-_MAILBOX_KEY = os.getenv("MAILBOX_KEY")
-_TARGET_SECRET_KEY = os.getenv("TARGET_SECRET_KEY")
-_GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+from _env_compiler import compile_env, load_compiled_env
 
-# Validate required keys - use warnings instead of hard failures to allow graceful degradation
-# This allows agents to start even if some keys are missing (they'll log warnings and use fallbacks)
-import logging
 _logger = logging.getLogger(__name__)
 
-if not _AGENTVERSE_KEY:
-    _logger.warning("⚠️  AGENTVERSE_KEY missing. Set in agent/.env - AgentVerse features will be disabled")
-    _AGENTVERSE_KEY = ""  # Allow empty, agents will handle gracefully
+# Parsed agent/.env contents keyed by path, alongside the file's mtime at parse time
+_ENV_CACHE: dict[str, tuple[int, dict[str, str]]] = {}
+
+
+def _load_dotenv() -> None:
+    """
+    Apply agent/.env to os.environ without overriding variables already set.
+    
+    The parsed file is cached by mtime, so repeated calls (e.g. from
+    reload_config) only re-parse it after it has changed, and compiled to
+    agent/_env_cache.py so new processes can skip parsing too. dotenv is
+    only imported when there is a file to parse; deployments that inject
+    the environment directly never load it.
+    """
+    # Load from agent/.env file specifically
+    env_path = os.path.join(os.path.dirname(__file__), ".env")
+    try:
+        mtime_ns = os.stat(env_path).st_mtime_ns
+    except FileNotFoundError:
+        return
+    
+    cached = _ENV_CACHE.get(env_path)
+    if cached is None or cached[0] != mtime_ns:
+        # Other processes may already have compiled this version of the file
+        values = load_compiled_env(mtime_ns)
+        if values is None:
+            try:
+                from dotenv import dotenv_values
+            except ImportError:
+                return  # dotenv not available, continue without it
+            values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+            compile_env(values, mtime_ns)
+        cached = _ENV_CACHE[env_path] = (mtime_ns, values)
+    for key, value in cached[1].items():
+        os.environ.setdefault(key, value)
+
+
+def _load_env() -> dict[str, str]:
+    """Take a plain-dict snapshot of os.environ for Config field defaults."""
+    return dict(os.environ)
+
+
+def _env_field(name: str, default: str, convert: Callable[[str], Any] = str, check: Optional[str] = None):
+    """
+    Dataclass field whose default is read from the environment snapshot.
+    
+    check marks the field for Config.validate(): "required" or "critical".
+    """
+    return field(
+        default_factory=lambda: convert(_ENV.get(name, default)),
+        metadata={"check": check},
+    )
+
+
+def _env_flag(value: str) -> bool:
+    return value.lower() == "true"
+
+
+# Integer settings and their defaults, converted together whenever the
+# environment snapshot is taken
+_INT_FIELDS = {
+    "UNIBASE_CHAIN_ID": 1337,
+    "REDIS_PORT": 6379,
+    "REDIS_DB": 0,
+    "TARGET_PORT": 8000,
+    "JUDGE_PORT": 8002,
+    "RED_TEAM_PORT": 8001,
+    "AGENT_API_PORT": 8003,
+}
+
+
+def _load_ints(env: dict[str, str]) -> dict[str, int]:
+    """Convert the integer settings present in env, falling back to their defaults."""
+    return {name: int(env[name]) if name in env else default for name, default in _INT_FIELDS.items()}
+
 
-if not _ASI_API_KEY:
-    _logger.warning("⚠️  ASI_API_KEY missing. Set in agent/.env - ASI.Cloud features will be disabled")
-    _ASI_API_KEY = ""  # Allow empty, agents will use Gemini or fallback payloads
+def _int_field(name: str):
+    """Dataclass field whose default is the pre-converted integer setting."""
+    return field(default_factory=lambda: _INTS[name])
 
-if not _GEMINI_API_KEY:
-    _logger.warning("⚠️  GEMINI_API_KEY missing. Set in agent/.env - Gemini fallback will be disabled")
-    _GEMINI_API_KEY = ""  # Allow empty, will use hardcoded fallbacks
 
-if not _TARGET_SECRET_KEY:
-    _logger.warning("⚠️  TARGET_SECRET_KEY missing. Set in agent/.env - Using default seed")
-    _TARGET_SECRET_KEY = "default_agent_seed_please_set_in_env"  # Provide a default for testing
+_load_dotenv()
+_ENV = _load_env()
+_INTS = _load_ints(_ENV)
 
+# Seed used when TARGET_SECRET_KEY is not set - provided for testing only
+_DEFAULT_TARGET_SECRET_KEY = "default_agent_seed_please_set_in_env"
 
-@dataclass
+# Validate required keys - use warnings instead of hard failures to allow graceful degradation
+# This allows agents to start even if some keys are missing (they'll log warnings and use fallbacks)
+_OPTIONAL_KEYS = (
+    ("AGENTVERSE_KEY", "AgentVerse features will be disabled"),
+    ("ASI_API_KEY", "ASI.Cloud features will be disabled"),
+    ("GEMINI_API_KEY", "Gemini fallback will be disabled"),
+    ("TARGET_SECRET_KEY", "Using default seed"),
+)
+for _key, _impact in _OPTIONAL_KEYS:
+    if not _ENV.get(_key):
+        _logger.warning(f"⚠️  {_key} missing. Set in agent/.env - {_impact}")
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     Configuration class for Judge Agent.
     
-    Loads configuration from environment variables.
+    Loads configuration from environment variables. Instances are immutable
+    so the shared instance can be cached safely; use reload_config() to pick
+    up changes.
     """
     
+    # Names of the fields validate() checks, filled in below from field metadata
+    _REQUIRED: ClassVar[tuple[str, ...]]
+    _CRITICAL: ClassVar[tuple[str, ...]]
+    _CHECK_GETTER: ClassVar[Callable[[Any], tuple]]
+    
     # Unibase Configuration
     # Corrected to valid 42-character Ethereum address
-    UNIBASE_ACCOUNT: str = os.getenv("UNIBASE_ACCOUNT", "0x742d35Cc6634C0532925a3b844Bc9e8bE1595F0B")
-    UNIBASE_RPC_URL: str = os.getenv("UNIBASE_RPC_URL", "https://testnet.unibase.io")
-    UNIBASE_CHAIN_ID: int = int(os.getenv("UNIBASE_CHAIN_ID", "1337"))
+    UNIBASE_ACCOUNT: str = _env_field("UNIBASE_ACCOUNT", "0x742d35Cc6634C0532925a3b844Bc9e8bE1595F0B", check="required")
+    UNIBASE_RPC_URL: str = _env_field("UNIBASE_RPC_URL", "https://testnet.unibase.io")
+    UNIBASE_CHAIN_ID: int = _int_field("UNIBASE_CHAIN_ID")
     
     # Membase Configuration
-    MEMBASE_ACCOUNT: str = os.getenv("MEMBASE_ACCOUNT", "")
-    MEMBASE_CONVERSATION_ID: str = os.getenv("MEMBASE_CONVERSATION_ID", "bounty-audit-log")
-    MEMBASE_ID: str = os.getenv("MEMBASE_ID", "judge-agent")
+    MEMBASE_ACCOUNT: str = _env_field("MEMBASE_ACCOUNT", "", check="required")
+    MEMBASE_CONVERSATION_ID: str = _env_field("MEMBASE_CONVERSATION_ID", "bounty-audit-log")
+    MEMBASE_ID: str = _env_field("MEMBASE_ID", "judge-agent")
+    AUDIT_BLOCK_WHEN_FULL: bool = _env_field("AUDIT_BLOCK_WHEN_FULL", "false", _env_flag)
     
     # Judge Agent Configuration
-    JUDGE_PRIVATE_KEY: str = os.getenv("JUDGE_PRIVATE_KEY", "")
-    BOUNTY_TOKEN_ADDRESS: str = os.getenv("BOUNTY_TOKEN_ADDRESS", "")
+    JUDGE_PRIVATE_KEY: str = _env_field("JUDGE_PRIVATE_KEY", "", check="required")
+    BOUNTY_TOKEN_ADDRESS: str = _env_field("BOUNTY_TOKEN_ADDRESS", "", check="required")
     
     # API Keys (Required) - no hardcoded defaults
-    ASI_API_KEY: str = _ASI_API_KEY or ""
-    AGENTVERSE_KEY: str = _AGENTVERSE_KEY or ""
-    MAILBOX_KEY: str = _MAILBOX_KEY or ""
-    TARGET_SECRET_KEY: str = _TARGET_SECRET_KEY or ""
-    GEMINI_API_KEY: str = _GEMINI_API_KEY or ""
+    ASI_API_KEY: str = _env_field("ASI_API_KEY", "", check="required")
+    AGENTVERSE_KEY: str = _env_field("AGENTVERSE_KEY", "", check="required")
+    MAILBOX_KEY: str = _env_field("MAILBOX_KEY", "", check="required")
+    TARGET_SECRET_KEY: str = field(
+        default_factory=lambda: _ENV.get("TARGET_SECRET_KEY") or _DEFAULT_TARGET_SECRET_KEY,
+        metadata={"check": "required"},
+    )
+    GEMINI_API_KEY: str = _env_field("GEMINI_API_KEY", "")
     
     # Bounty Rates (in tokens)
     BOUNTY_LOW: int = 50
@@ -90,31 +167,34 @@ class Config:
     MAX_SINGLE_BOUNTY: int = 1000
     DAILY_BOUNTY_CAP: int = 10000
     
+    # Attack Tracking
+    MAX_ACTIVE_ATTACKS: int = 10000  # least recently used tracked attacks are evicted past this
+    
     # Verification Settings
     EXPLOIT_TIMEOUT_MINUTES: int = 5
     MIN_CONFIDENCE_THRESHOLD: float = 0.8
     REQUIRE_PROOF: bool = True
     
     # Redis Configuration
-    REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
-    REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
-    REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
+    REDIS_HOST: str = _env_field("REDIS_HOST", "localhost")
+    REDIS_PORT: int = _int_field("REDIS_PORT")
+    REDIS_DB: int = _int_field("REDIS_DB")
     
     # Midnight Configuration
-    MIDNIGHT_API_URL: str = os.getenv("MIDNIGHT_API_URL", "http://localhost:8100")
-    MIDNIGHT_CONTRACT_ADDRESS: str = os.getenv("MIDNIGHT_CONTRACT_ADDRESS", "")
-    MIDNIGHT_DEVNET_URL: str = os.getenv("MIDNIGHT_DEVNET_URL", "http://localhost:6300")
-    MIDNIGHT_BRIDGE_URL: str = os.getenv("MIDNIGHT_BRIDGE_URL", "http://localhost:3000")
-    MIDNIGHT_SIMULATION_MODE: bool = os.getenv("MIDNIGHT_SIMULATION_MODE", "false").lower() == "true"
+    MIDNIGHT_API_URL: str = _env_field("MIDNIGHT_API_URL", "http://localhost:8100", check="critical")
+    MIDNIGHT_CONTRACT_ADDRESS: str = _env_field("MIDNIGHT_CONTRACT_ADDRESS", "")
+    MIDNIGHT_DEVNET_URL: str = _env_field("MIDNIGHT_DEVNET_URL", "http://localhost:6300")
+    MIDNIGHT_BRIDGE_URL: str = _env_field("MIDNIGHT_BRIDGE_URL", "http://localhost:3000")
+    MIDNIGHT_SIMULATION_MODE: bool = _env_field("MIDNIGHT_SIMULATION_MODE", "false", _env_flag)
     
     # Agent Ports Configuration
-    TARGET_PORT: int = int(os.getenv("TARGET_PORT", "8000"))
-    JUDGE_PORT: int = int(os.getenv("JUDGE_PORT", "8002"))
-    RED_TEAM_PORT: int = int(os.getenv("RED_TEAM_PORT", "8001"))
-    AGENT_API_PORT: int = int(os.getenv("AGENT_API_PORT", "8003"))
+    TARGET_PORT: int = _int_field("TARGET_PORT")
+    JUDGE_PORT: int = _int_field("JUDGE_PORT")
+    RED_TEAM_PORT: int = _int_field("RED_TEAM_PORT")
+    AGENT_API_PORT: int = _int_field("AGENT_API_PORT")
     
     # Agent API URL
-    AGENT_API_URL: str = os.getenv("AGENT_API_URL", "http://localhost:8003")
+    AGENT_API_URL: str = _env_field("AGENT_API_URL", "http://localhost:8003")
     
     def validate(self, strict: bool = False):
         """
@@ -126,40 +206,21 @@ class Config:
         Raises:
             ValueError: If strict=True and any required configuration is missing
         """
-        required = [
-            "UNIBASE_ACCOUNT",
-            "MEMBASE_ACCOUNT",
-            "JUDGE_PRIVATE_KEY",
-            "BOUNTY_TOKEN_ADDRESS",
-            "ASI_API_KEY",
-            "AGENTVERSE_KEY",
-            "MAILBOX_KEY",
-            "TARGET_SECRET_KEY"
-        ]
-        
-        # Critical config that should always be checked
-        critical = [
-            "MIDNIGHT_API_URL"
-        ]
-        
-        missing = []
-        for field in required:
-            value = getattr(self, field, "")
-            if not value or value.strip() == "":
-                missing.append(field)
+        values = self._CHECK_GETTER(self)
+        missing = tuple(
+            name for name, value in zip(self._REQUIRED, values)
+            if not (value and value.strip())
+        )
         
         # Check critical config
-        critical_missing = []
-        for field in critical:
-            value = getattr(self, field, "")
-            if not value or value.strip() == "":
-                critical_missing.append(field)
+        critical_missing = tuple(
+            name for name, value in zip(self._CRITICAL, values[len(self._REQUIRED):])
+            if not (value and value.strip())
+        )
         
         # Log warnings for critical missing config (prevents silent failures)
         if critical_missing:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(
+            _logger.warning(
                 f"⚠️  CRITICAL: Missing configuration variables: {', '.join(critical_missing)}\n"
                 f"This may cause silent failures. Please set these in agent/.env file.\n"
                 f"See env.example for reference."
@@ -174,17 +235,18 @@ class Config:
             if strict:
                 raise ValueError(error_msg)
             else:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"⚠️  {error_msg}")
+                _logger.warning(f"⚠️  {error_msg}")
         
-        return len(missing) == 0 and len(critical_missing) == 0
+        return not missing and not critical_missing
 
 
-# Global config instance (singleton pattern)
-_config_instance = None
+# Fields checked by validate(), taken from each field's "check" metadata
+Config._REQUIRED = tuple(f.name for f in fields(Config) if f.metadata.get("check") == "required")
+Config._CRITICAL = tuple(f.name for f in fields(Config) if f.metadata.get("check") == "critical")
+Config._CHECK_GETTER = operator.attrgetter(*Config._REQUIRED, *Config._CRITICAL)
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
     """
     Get global configuration instance.
@@ -193,12 +255,10 @@ def get_config() -> Config:
     Returns:
         Config: Configuration instance
     """
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = Config()
-        # Validate critical config (non-strict, just warnings)
-        _config_instance.validate(strict=False)
-    return _config_instance
+    config = Config()
+    # Validate critical config (non-strict, just warnings)
+    config.validate(strict=False)
+    return config
 
 
 def reload_config() -> Config:
@@ -208,6 +268,9 @@ def reload_config() -> Config:
     Returns:
         Config: New configuration instance
     """
-    global _config_instance
-    _config_instance = Config()
-    return _config_instance
+    global _ENV, _INTS
+    _load_dotenv()
+    _ENV = _load_env()
+    _INTS = _load_ints(_ENV)
+    get_config.cache_clear()
+    return get_config()
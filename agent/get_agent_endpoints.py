@@ -6,21 +6,48 @@ for Red Team, Target, and Judge agents.
 """
 import os
 import sys
+import time
 import requests
 from pathlib import Path
 
 # Add agent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Public IP lookups are cached on disk so repeated runs skip the HTTP request
+PUBLIC_IP_CACHE_FILE = Path.home() / ".cache" / "0xguard" / "public_ip"
+PUBLIC_IP_CACHE_TTL = 3600  # seconds
+_public_ip = None  # Last successful lookup in this process; failures are not cached
+
 
 def get_public_ip():
     """Get the public IP address of the current machine."""
+    global _public_ip
+    if _public_ip:
+        return _public_ip
+    
     try:
-        response = requests.get('https://api.ipify.org?format=json', timeout=5)
-        return response.json()['ip']
+        if time.time() - PUBLIC_IP_CACHE_FILE.stat().st_mtime < PUBLIC_IP_CACHE_TTL:
+            cached_ip = PUBLIC_IP_CACHE_FILE.read_text().strip()
+            if cached_ip:
+                _public_ip = cached_ip
+                return cached_ip
+    except OSError:
+        pass  # No usable cache, fall through to the lookup
+    
+    try:
+        response = requests.get('https://api.ipify.org?format=json', timeout=2)
+        public_ip = response.json()['ip']
     except Exception as e:
         print(f"⚠️  Warning: Could not fetch public IP: {e}")
         return None
+    
+    try:
+        PUBLIC_IP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PUBLIC_IP_CACHE_FILE.write_text(public_ip)
+    except OSError:
+        pass  # Caching is best-effort
+    _public_ip = public_ip
+    return public_ip
 
 
 def get_agent_endpoints():
@@ -28,32 +55,37 @@ def get_agent_endpoints():
     Get the endpoint URLs for all three agents.
     
     Returns:
-        dict: Dictionary with agent names and their endpoint URLs
+        tuple: (endpoints, public_ip, ports) where endpoints and ports are
+        dictionaries keyed by agent name
     """
+    env = os.environ
+    
     # Get public IP
     public_ip = get_public_ip()
     
     # If public IP not available, try environment variable or use localhost
     if not public_ip:
-        public_ip = os.getenv("AGENT_PUBLIC_IP") or os.getenv("AGENT_IP", "localhost")
+        public_ip = env.get("AGENT_PUBLIC_IP") or env.get("AGENT_IP", "localhost")
         print(f"⚠️  Using IP from environment or localhost: {public_ip}")
         print("   Note: For Agentverse, you need a publicly accessible IP address.\n")
     else:
         print(f"✅ Public IP detected: {public_ip}\n")
     
     # Get ports from environment or use defaults
-    red_team_port = os.getenv("RED_TEAM_PORT") or os.getenv("AGENT_PORT", "8001")
-    target_port = os.getenv("TARGET_PORT") or os.getenv("AGENT_PORT", "8000")
-    judge_port = os.getenv("JUDGE_PORT") or os.getenv("AGENT_PORT", "8002")
+    red_team_port = env.get("RED_TEAM_PORT") or env.get("AGENT_PORT", "8001")
+    target_port = env.get("TARGET_PORT") or env.get("AGENT_PORT", "8000")
+    judge_port = env.get("JUDGE_PORT") or env.get("AGENT_PORT", "8002")
     
-    # Construct endpoints
-    endpoints = {
-        "red_team": f"http://{public_ip}:{red_team_port}/submit",
-        "target": f"http://{public_ip}:{target_port}/submit",
-        "judge": f"http://{public_ip}:{judge_port}/submit",
+    ports = {
+        "red_team": red_team_port,
+        "target": target_port,
+        "judge": judge_port,
     }
     
-    return endpoints, public_ip
+    # Construct endpoints
+    endpoints = {name: f"http://{public_ip}:{port}/submit" for name, port in ports.items()}
+    
+    return endpoints, public_ip, ports
 
 
 def main():
@@ -63,7 +95,7 @@ def main():
     print("=" * 70)
     print()
     
-    endpoints, public_ip = get_agent_endpoints()
+    endpoints, public_ip, ports = get_agent_endpoints()
     
     print("📋 Agent Endpoints:")
     print("-" * 70)
@@ -91,9 +123,9 @@ def main():
     print()
     print("=" * 70)
     print("💡 Note: Ensure these ports are open and accessible:")
-    print(f"   - Port {endpoints['red_team'].split(':')[-1].split('/')[0]} (Red Team)")
-    print(f"   - Port {endpoints['target'].split(':')[-1].split('/')[0]} (Target)")
-    print(f"   - Port {endpoints['judge'].split(':')[-1].split('/')[0]} (Judge)")
+    print(f"   - Port {ports['red_team']} (Red Team)")
+    print(f"   - Port {ports['target']} (Target)")
+    print(f"   - Port {ports['judge']} (Judge)")
     print("=" * 70)
 
 
@@ -3,6 +3,7 @@
 Script to get mailbox UUIDs for all three agents from AgentVerse API
 """
 import sys
+import asyncio
 import httpx
 from pathlib import Path
 
@@ -14,46 +15,58 @@ from red_team import create_red_team_agent
 from config import get_config
 
 
-async def get_mailbox_uuid(agent_address: str, agent_name: str, api_key: str = None) -> dict:
+def _create_agent(factory, **kwargs):
+    """
+    Run an agent factory on a worker thread.
+    
+    uagents binds each Agent to the calling thread's event loop, so the
+    worker gets a private one. The agents are only used for their addresses
+    here and are never run, so the loop is closed once the Agent is built.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return factory(**kwargs)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+async def get_mailbox_uuid(client: httpx.AsyncClient, agent_address: str, agent_name: str) -> dict:
     """
     Get mailbox UUID for an agent from AgentVerse API.
     
     Args:
+        client: Shared AgentVerse HTTP client carrying the Authorization header
         agent_address: The agent's address
         agent_name: Name of the agent (for display)
-        api_key: AgentVerse API key for authentication
         
     Returns:
         dict with agent_name, address, and mailbox_uuid
     """
     url = f"https://agentverse.ai/v2/agents/{agent_address}/mailbox/uuid"
     
-    headers = {}
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
-    
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                data = response.json()
-                mailbox_uuid = data.get("mailbox_uuid") or data.get("uuid") or data.get("mailbox") or str(data)
-                return {
-                    "agent": agent_name,
-                    "address": agent_address,
-                    "mailbox_uuid": mailbox_uuid,
-                    "status": "success",
-                    "full_response": data
-                }
-            else:
-                return {
-                    "agent": agent_name,
-                    "address": agent_address,
-                    "mailbox_uuid": None,
-                    "status": "error",
-                    "error": f"HTTP {response.status_code}: {response.text}"
-                }
+        response = await client.get(url)
+        
+        if response.status_code == 200:
+            data = response.json()
+            mailbox_uuid = data.get("mailbox_uuid") or data.get("uuid") or data.get("mailbox") or str(data)
+            return {
+                "agent": agent_name,
+                "address": agent_address,
+                "mailbox_uuid": mailbox_uuid,
+                "status": "success",
+                "full_response": data
+            }
+        else:
+            return {
+                "agent": agent_name,
+                "address": agent_address,
+                "mailbox_uuid": None,
+                "status": "error",
+                "error": f"HTTP {response.status_code}: {response.text}"
+            }
     except Exception as e:
         return {
             "agent": agent_name,
@@ -66,8 +79,6 @@ async def get_mailbox_uuid(agent_address: str, agent_name: str, api_key: str = N
 
 async def main():
     """Get mailbox UUIDs for all agents"""
-    import asyncio
-    
     print("=" * 70)
     print("📬 Getting Mailbox UUIDs from AgentVerse")
     print("=" * 70)
@@ -85,34 +96,41 @@ async def main():
     print(f"✅ Using AGENTVERSE_KEY: {api_key[:10]}...{api_key[-10:]}")
     print()
     
-    # Create agents to get their addresses
-    print("🔍 Getting agent addresses...")
-    judge = create_judge_agent(port=8002)
-    target = create_target_agent(port=8000, judge_address=judge.address)
-    red_team = create_red_team_agent(
-        target_address=target.address,
-        port=8001,
-        judge_address=judge.address
-    )
-    
-    judge_addr = judge.address
-    target_addr = target.address
-    red_team_addr = red_team.address
-    
-    print(f"✅ Judge Agent:   {judge_addr}")
-    print(f"✅ Target Agent:  {target_addr}")
-    print(f"✅ Red Team Agent: {red_team_addr}")
-    print()
-    
-    # Get mailbox UUIDs
-    print("📡 Fetching mailbox UUIDs from AgentVerse API...")
-    print()
-    
-    results = await asyncio.gather(
-        get_mailbox_uuid(judge_addr, "Judge", api_key),
-        get_mailbox_uuid(target_addr, "Target", api_key),
-        get_mailbox_uuid(red_team_addr, "Red Team", api_key)
-    )
+    # One client for all three lookups so they share the connection pool
+    async with httpx.AsyncClient(
+        timeout=10.0,
+        headers={"Authorization": f"Bearer {api_key}"},
+    ) as client:
+        # Create agents to get their addresses. Each one needs the previous
+        # agent's address, so they are built in order off the event loop, and
+        # each mailbox lookup starts as soon as its address is known.
+        print("🔍 Getting agent addresses...")
+        judge = await asyncio.to_thread(_create_agent, create_judge_agent, port=8002)
+        print(f"✅ Judge Agent:   {judge.address}")
+        judge_task = asyncio.create_task(get_mailbox_uuid(client, judge.address, "Judge"))
+        
+        target = await asyncio.to_thread(
+            _create_agent, create_target_agent, port=8000, judge_address=judge.address
+        )
+        print(f"✅ Target Agent:  {target.address}")
+        target_task = asyncio.create_task(get_mailbox_uuid(client, target.address, "Target"))
+        
+        red_team = await asyncio.to_thread(
+            _create_agent,
+            create_red_team_agent,
+            target_address=target.address,
+            port=8001,
+            judge_address=judge.address
+        )
+        print(f"✅ Red Team Agent: {red_team.address}")
+        red_team_task = asyncio.create_task(get_mailbox_uuid(client, red_team.address, "Red Team"))
+        print()
+        
+        # Get mailbox UUIDs
+        print("📡 Fetching mailbox UUIDs from AgentVerse API...")
+        print()
+        
+        results = await asyncio.gather(judge_task, target_task, red_team_task)
     
     # Display results
     print("=" * 70)
@@ -159,7 +177,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
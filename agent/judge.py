@@ -12,13 +12,37 @@ from uagents_core.contrib.protocols.chat import (  # pyright: ignore[reportMissi
 )
 import sys
 import os
+import asyncio
+import functools
+import time
+import hashlib
+import re
 import httpx  # pyright: ignore[reportMissingImports]
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+
+# Prefer orjson for parsing LLM responses, falling back to the stdlib
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Optional incremental parser for ASI responses; the body is buffered if missing
+try:
+    import ijson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    ijson = None
 
 # Add agent directory to path for logger import
 sys.path.insert(0, str(Path(__file__).parent))
-from logger import log
+from logger import log, log_lazy
 from unibase import save_bounty_token, UnibaseClient
 from config import get_config
 from midnight_client import (
@@ -58,6 +82,83 @@ GEMINI_API_URL = os.getenv("GEMINI_API_URL", "https://generativelanguage.googlea
 # AgentVerse API Configuration (from config)
 AGENTVERSE_KEY = config.AGENTVERSE_KEY
 
+# ERC-3009 payouts after verified proofs (read once, checked per vulnerability)
+ERC3009_PAYOUTS_ENABLED = os.getenv("ERC3009_PAYOUTS_ENABLED", "false").lower() == "true"
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_judge_env() -> tuple[str, Optional[str], str]:
+    """Resolve the judge's IP, port override and seed from the environment once."""
+    agent_ip = os.getenv("JUDGE_IP") or os.getenv("AGENT_IP", "localhost")
+    agent_port = os.getenv("AGENT_PORT_JUDGE")
+    # All agents use TARGET_SECRET_KEY as seed for consistency (can be overridden via JUDGE_SEED or AGENT_SEED)
+    agent_seed = os.getenv("JUDGE_SEED") or os.getenv("AGENT_SEED") or config.TARGET_SECRET_KEY
+    return agent_ip, agent_port, agent_seed
+
+# Shared ASI.Cloud HTTP client, created on first use so connections are kept
+# alive across vulnerability analyses. Closed by the judge's shutdown handler.
+_ASI_CLIENT: httpx.AsyncClient | None = None
+
+# HTTP/2 lets concurrent analyses share one connection; it needs the optional h2 package
+try:
+    import h2  # noqa: F401  # pyright: ignore[reportMissingImports]
+    _ASI_HTTP2 = True
+except ImportError:
+    _ASI_HTTP2 = False
+
+
+def _get_asi_client() -> httpx.AsyncClient:
+    """Return the shared ASI.Cloud client, creating it if needed."""
+    global _ASI_CLIENT
+    if _ASI_CLIENT is None or _ASI_CLIENT.is_closed:
+        _ASI_CLIENT = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {ASI_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            http2=_ASI_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _ASI_CLIENT
+
+
+async def close_asi_client() -> None:
+    """Close the shared ASI.Cloud client if it was opened."""
+    global _ASI_CLIENT
+    if _ASI_CLIENT is not None:
+        await _ASI_CLIENT.aclose()
+        _ASI_CLIENT = None
+
+
+# Shared Unibase client for bounty payouts, created on first use since
+# construction raises ValueError when the Unibase settings are missing
+_UNIBASE_CLIENT: UnibaseClient | None = None
+
+
+def _get_unibase_client() -> UnibaseClient:
+    """Return the shared Unibase client, creating it if needed."""
+    global _UNIBASE_CLIENT
+    if _UNIBASE_CLIENT is None:
+        _UNIBASE_CLIENT = UnibaseClient()
+    return _UNIBASE_CLIENT
+
+
+# Size limits for the judge's in-memory tracking state
+ATTACK_FLOW_SIZE = 10
+MONITORED_ATTACKS_SIZE = 64
+AUDIT_PROOFS_SIZE = 1024
+VERIFIED_PROOFS_SIZE = 1024
+
+
+def _bounded_set(mapping: OrderedDict, key, value, maxsize: int) -> None:
+    """Store key as the most recent entry of mapping, evicting the oldest beyond maxsize."""
+    mapping[key] = value
+    mapping.move_to_end(key)
+    if len(mapping) > maxsize:
+        mapping.popitem(last=False)
+
+
 # Import message models - define locally to avoid circular imports
 class ResponseMessage(Model):
     status: str
@@ -68,9 +169,27 @@ class AttackMessage(Model):
     payload: str
 
 
+@dataclass(frozen=True, slots=True)
+class _AttackRecord:
+    """Internal attack_flow entry, converted from AttackMessage at the handler boundary."""
+    sender: str
+    payload: str
+    timestamp_ns: int
+
+
 # SECRET_KEY from target - use configuration
 SECRET_KEY = config.TARGET_SECRET_KEY
 
+# Tokens whose presence in a Target response means a secret leaked. They are
+# matched in a single regex pass, so adding indicators does not add scans.
+LEAK_INDICATORS = (SECRET_KEY,)
+_LEAK_RE = re.compile("|".join(re.escape(token) for token in LEAK_INDICATORS))
+
+
+def contains_leak(message: str) -> bool:
+    """Return True if message contains any leak indicator."""
+    return _LEAK_RE.search(message) is not None
+
 
 async def call_gemini_api(prompt: str) -> str:
     """
@@ -131,10 +250,87 @@ async def call_gemini_api(prompt: str) -> str:
     return ""
 
 
+# Default analyses used when no LLM result is available
+_NO_LLM_ANALYSIS = {
+    "risk_score": 75,
+    "severity": "HIGH",
+    "recommendation": "Review vulnerability manually"
+}
+_SECRET_LEAK_ANALYSIS = {
+    "risk_score": 98,
+    "severity": "CRITICAL",
+    "recommendation": "Immediate remediation required. Secret key exposure detected."
+}
+
+# Vulnerability analysis prompt; payload and response are filled in per call
+_ASI_PROMPT_TMPL = """You are a cybersecurity expert analyzing a vulnerability. 
+    
+Exploit Payload: {payload}
+Target Response: {response}
+
+Analyze this vulnerability and provide:
+1. Risk score (0-100)
+2. Severity level (LOW, MEDIUM, HIGH, CRITICAL)
+3. Brief recommendation
+
+Return JSON format: {{"risk_score": number, "severity": "string", "recommendation": "string"}}"""
+
+# JSON object inside a markdown code fence (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def _extract_json(text: str) -> str:
+    """Extract JSON from markdown code blocks if present."""
+    match = _FENCE_RE.search(text)
+    return match.group(1) if match else text
+
+
+# Static part of the ASI.Cloud chat completion request body
+_ASI_BODY_BASE = {
+    "model": "asi1-mini",
+    "max_tokens": 200,
+    "temperature": 0.3,
+}
+
+# LLM analyses keyed by a digest of (exploit payload, target response), most recent last
+ANALYSIS_CACHE_SIZE = 512
+_ANALYSIS_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+
+# Analyses currently being requested, keyed like _ANALYSIS_CACHE; beyond
+# INFLIGHT_LIMIT distinct keys, requests run without coalescing
+INFLIGHT_LIMIT = 256
+_INFLIGHT: dict[str, asyncio.Future] = {}
+
+
+def _analysis_key(exploit_payload: str, response_message: str) -> str:
+    """Cache key covering both the payload and the response it produced."""
+    data = f"{exploit_payload}\x00{response_message}".encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _fast_classify(exploit_payload: str, response_message: str) -> Optional[dict]:
+    """
+    Classify a response locally when the outcome is not in doubt.
+    
+    A response that echoes the target's secret key is always a CRITICAL leak,
+    so the LLM round-trip adds nothing; anything else is left to ASI.
+    
+    Returns:
+        dict: The CRITICAL analysis, or None if the response needs ASI
+    """
+    if SECRET_KEY and SECRET_KEY in response_message:
+        return dict(_SECRET_LEAK_ANALYSIS)
+    return None
+
+
 async def analyze_vulnerability_with_asi(exploit_payload: str, response_message: str) -> dict:
     """
     Use ASI.Cloud API to analyze vulnerability severity and generate risk assessment.
     
+    LLM results are cached per (payload, response) pair so repeated exploits
+    skip the round-trip; default assessments are not cached and are retried.
+    Concurrent calls for the same pair share a single in-flight request.
+    
     Args:
         exploit_payload: The exploit payload that triggered the vulnerability
         response_message: The response message from the target
@@ -142,17 +338,80 @@ async def analyze_vulnerability_with_asi(exploit_payload: str, response_message:
     Returns:
         dict: Analysis results with risk_score, severity, and recommendations
     """
-    prompt = f"""You are a cybersecurity expert analyzing a vulnerability. 
+    key = _analysis_key(exploit_payload, response_message)
+    cached = _ANALYSIS_CACHE.get(key)
+    if cached is not None:
+        _ANALYSIS_CACHE.move_to_end(key)
+        return dict(cached)
+    
+    inflight = _INFLIGHT.get(key)
+    if inflight is not None:
+        # Shield so a cancelled waiter does not cancel the shared request
+        analysis = await asyncio.shield(inflight)
+        if analysis is not None:
+            return dict(analysis)
+        # The owning request failed or was cancelled; fetch independently
+        return dict(await _fetch_analysis(key, exploit_payload, response_message))
+    
+    if len(_INFLIGHT) >= INFLIGHT_LIMIT:
+        return dict(await _fetch_analysis(key, exploit_payload, response_message))
+    
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    try:
+        analysis = await _fetch_analysis(key, exploit_payload, response_message)
+        future.set_result(analysis)
+    finally:
+        del _INFLIGHT[key]
+        if not future.done():
+            # Resolve with None rather than cancelling, so waiters are not
+            # handed a CancelledError that looks like their own cancellation
+            future.set_result(None)
+    return dict(analysis)
+
+
+async def _fetch_analysis(key: str, exploit_payload: str, response_message: str) -> dict:
+    """Request an analysis, caching it on success or returning the default."""
+    analysis = await _request_vulnerability_analysis(exploit_payload, response_message)
+    if analysis is None:
+        return _SECRET_LEAK_ANALYSIS if ASI_API_KEY and ASI_API_KEY.strip() else _NO_LLM_ANALYSIS
+    
+    _ANALYSIS_CACHE[key] = analysis
+    if len(_ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+        _ANALYSIS_CACHE.popitem(last=False)
+    return analysis
+
+
+async def _read_completion_content(response: httpx.Response) -> str:
+    """
+    Extract choices[0].message.content from a streamed chat completion.
+    
+    With ijson installed the body is parsed as it arrives and reading stops
+    at the first content string, so the rest of the document is never
+    materialized; otherwise the body is buffered and parsed in one go.
+    """
+    if ijson is None:
+        data = _json_loads(await response.aread())
+        return data.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
     
-Exploit Payload: {exploit_payload}
-Target Response: {response_message}
+    contents = ijson.sendable_list()
+    parser = ijson.items_coro(contents, "choices.item.message.content")
+    async for chunk in response.aiter_bytes():
+        parser.send(chunk)
+        if contents:
+            return (contents[0] or "").strip()
+    parser.close()
+    return (contents[0] or "").strip() if contents else ""
 
-Analyze this vulnerability and provide:
-1. Risk score (0-100)
-2. Severity level (LOW, MEDIUM, HIGH, CRITICAL)
-3. Brief recommendation
 
-Return JSON format: {{"risk_score": number, "severity": "string", "recommendation": "string"}}"""
+async def _request_vulnerability_analysis(exploit_payload: str, response_message: str) -> Optional[dict]:
+    """
+    Ask ASI.Cloud (or Gemini when ASI is not configured) to analyze a vulnerability.
+    
+    Returns:
+        dict: Parsed analysis, or None if no LLM produced a usable result
+    """
+    prompt = _ASI_PROMPT_TMPL.format(payload=exploit_payload, response=response_message)
     
     # Try ASI.Cloud first, then Gemini, then fallback
     if not ASI_API_KEY or not ASI_API_KEY.strip():
@@ -161,71 +420,38 @@ Return JSON format: {{"risk_score": number, "severity": "string", "recommendatio
             log("ASI.Cloud", "ASI_API_KEY not configured, trying Gemini fallback", "🧠", "info")
             gemini_response = await call_gemini_api(prompt)
             if gemini_response:
-                import json
                 try:
-                    # Extract JSON from markdown code blocks if present
-                    analysis_text = gemini_response
-                    if "```json" in analysis_text:
-                        analysis_text = analysis_text.split("```json")[1].split("```")[0].strip()
-                    elif "```" in analysis_text:
-                        analysis_text = analysis_text.split("```")[1].split("```")[0].strip()
-                    analysis = json.loads(analysis_text)
+                    analysis = _json_loads(_extract_json(gemini_response))
                     log("Gemini", "Successfully analyzed vulnerability using Gemini", "🤖", "info")
                     return analysis
-                except json.JSONDecodeError:
+                except _JSONDecodeError:
                     log("Gemini", "Failed to parse JSON from Gemini response, using default", "🤖", "warning")
         
         # Final fallback to hardcoded values
         log("ASI.Cloud", "No LLM available, using default risk assessment", "🧠", "info")
-        return {
-            "risk_score": 75,
-            "severity": "HIGH",
-            "recommendation": "Review vulnerability manually"
-        }
+        return None
     
     try:
         log("ASI.Cloud", "Analyzing vulnerability severity...", "🧠", "info")
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                ASI_API_URL,
-                headers={
-                    "Authorization": f"Bearer {ASI_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "asi1-mini",
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "max_tokens": 200,
-                    "temperature": 0.3,
-                },
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                analysis_text = data.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
-                
-                if analysis_text:
-                    log("ASI.Cloud", f"Vulnerability analysis received", "🧠", "info")
-                    # Try to parse JSON from response
-                    import json
-                    try:
-                        # Extract JSON from markdown code blocks if present
-                        if "```json" in analysis_text:
-                            analysis_text = analysis_text.split("```json")[1].split("```")[0].strip()
-                        elif "```" in analysis_text:
-                            analysis_text = analysis_text.split("```")[1].split("```")[0].strip()
-                        analysis = json.loads(analysis_text)
-                        return analysis
-                    except:
-                        # Fallback: return default analysis
-                        pass
-                        
+        client = _get_asi_client()
+        async with client.stream(
+            "POST",
+            ASI_API_URL,
+            json={**_ASI_BODY_BASE, "messages": [{"role": "user", "content": prompt}]},
+        ) as response:
+            analysis_text = await _read_completion_content(response) if response.status_code == 200 else ""
+        
+        if analysis_text:
+            log("ASI.Cloud", f"Vulnerability analysis received", "🧠", "info")
+            # Try to parse JSON from response
+            try:
+                analysis = _json_loads(_extract_json(analysis_text))
+                return analysis
+            except _JSONDecodeError:
+                # Fallback: return default analysis
+                pass
+                    
     except httpx.TimeoutException:
         log("ASI.Cloud", "API request timeout, using default risk assessment", "🧠", "info")
     except httpx.RequestError as e:
@@ -234,11 +460,7 @@ Return JSON format: {{"risk_score": number, "severity": "string", "recommendatio
         log("ASI.Cloud", f"Unexpected error: {str(e)}, using default risk assessment", "🧠", "info")
     
     # Default fallback analysis
-    return {
-        "risk_score": 98,
-        "severity": "CRITICAL",
-        "recommendation": "Immediate remediation required. Secret key exposure detected."
-    }
+    return None
 
 
 def create_judge_agent(port: int = None) -> Agent:
@@ -252,10 +474,8 @@ def create_judge_agent(port: int = None) -> Agent:
         Agent: Configured Judge agent
     """
     # Get configuration from config.py
-    agent_ip = os.getenv("JUDGE_IP") or os.getenv("AGENT_IP", "localhost")
-    agent_port = port or int(os.getenv("AGENT_PORT_JUDGE") or config.JUDGE_PORT)
-    # All agents use TARGET_SECRET_KEY as seed for consistency (can be overridden via JUDGE_SEED or AGENT_SEED)
-    agent_seed = os.getenv("JUDGE_SEED") or os.getenv("AGENT_SEED") or config.TARGET_SECRET_KEY
+    agent_ip, env_port, agent_seed = _resolve_judge_env()
+    agent_port = port or int(env_port or config.JUDGE_PORT)
     
     # PHASE 3: Instantiate agent with name, seed, and port only
     judge = Agent(
@@ -296,12 +516,16 @@ def create_judge_agent(port: int = None) -> Agent:
         # Agent will continue to function without chat protocol
 
     state = {
-        "monitored_attacks": {},  # Track attack flow: {red_team_address: last_payload}
-        "attack_flow": [],  # Track attack sequence: [(red_team_address, payload, timestamp)]
+        "monitored_attacks": OrderedDict(),  # Track attack flow: {red_team_address: last_payload}, most recent last
+        "attack_flow": deque(maxlen=ATTACK_FLOW_SIZE),  # Track attack sequence: [_AttackRecord]
         "bounties_awarded": 0,
-        "audit_proofs": {},  # audit_id -> proof_hash
-        "verified_proofs": {},  # proof_id -> ProofVerificationResult
+        "audit_proofs": OrderedDict(),  # audit_id -> proof_hash, most recent last
+        "verified_proofs": OrderedDict(),  # (proof_id, auditor_id) -> valid ProofVerificationResult dict, most recent last
+        # Auditor ID for Midnight proofs: the judge address padded/truncated to 64 chars
+        "auditor_id": judge.address[:64].ljust(64, "0"),
     }
+    # Short form of the auditor ID used in log lines
+    state["auditor_short"] = state["auditor_id"][:16]
     
     # Initialize agent registry adapter
     registry_adapter = None
@@ -323,21 +547,22 @@ def create_judge_agent(port: int = None) -> Agent:
         # Initialize agent identity in registry
         if registry_adapter:
             try:
+                started_at = datetime.now().isoformat()
                 identity_data = {
                     "name": "Judge Agent",
                     "role": "monitor",
                     "capabilities": ["vulnerability_detection", "proof_verification", "bounty_distribution"],
                     "version": "1.0.0",
                     "address": judge.address,
-                    "started_at": datetime.now().isoformat()
+                    "started_at": started_at
                 }
-                result = registry_adapter.register_agent(judge.address, identity_data)
+                result = await asyncio.to_thread(registry_adapter.register_agent, judge.address, identity_data)
                 if result.get("success"):
                     log("Judge", f"[agent_identity_registered] Agent: {judge.address}, Unibase Key: {result.get('unibase', {}).get('key', 'N/A')}", "📝", "info")
                     # Update memory with startup info
                     if unibase_store:
-                        unibase_store.update_agent_memory(judge.address, {
-                            "startup_time": datetime.now().isoformat(),
+                        await asyncio.to_thread(unibase_store.update_agent_memory, judge.address, {
+                            "startup_time": started_at,
                             "status": "active"
                         })
                         log("Judge", f"[agent_memory_updated] Agent: {judge.address}", "💾", "info")
@@ -346,21 +571,22 @@ def create_judge_agent(port: int = None) -> Agent:
         
         # Agentverse registration is now handled via enable_agentverse() during agent creation
 
+    @judge.on_event("shutdown")
+    async def close_clients(ctx: Context):
+        await close_asi_client()
+
     @judge.on_message(model=AttackMessage)
     async def handle_attack_message(ctx: Context, sender: str, msg: AttackMessage):
         """
         Monitor attack messages from Red Team to track the attack flow.
         """
         ctx.logger.info(f"Judge intercepted attack from {sender}: '{msg.payload}'")
-        log("Judge", f"Monitoring attack: {sender} → Target (payload: '{msg.payload}')", "⚖️", "info")
+        log_lazy("Judge", "Monitoring attack: %s → Target (payload: '%s')", sender, msg.payload, emoji="⚖️", kind="info")
         
         # Track the attack for later correlation with response
-        state["monitored_attacks"][sender] = msg.payload
-        state["attack_flow"].append((sender, msg.payload, datetime.now().isoformat()))
-        
-        # Keep only last 10 attacks to prevent memory growth
-        if len(state["attack_flow"]) > 10:
-            state["attack_flow"] = state["attack_flow"][-10:]
+        # (both are bounded: the deque drops the oldest attack automatically)
+        _bounded_set(state["monitored_attacks"], sender, msg.payload, MONITORED_ATTACKS_SIZE)
+        state["attack_flow"].append(_AttackRecord(sender, msg.payload, time.time_ns()))
         
         # Update reputation after monitoring action (+1 for active monitoring)
         if registry_adapter:
@@ -370,224 +596,229 @@ def create_judge_agent(port: int = None) -> Agent:
                     "sender": sender,
                     "timestamp": datetime.now().isoformat()
                 }
-                rep_result = registry_adapter.record_agent_reputation(judge.address, delta=1, metadata=metadata)
+                rep_result = await asyncio.to_thread(registry_adapter.record_agent_reputation, judge.address, delta=1, metadata=metadata)
                 if rep_result.get("success"):
                     log("Judge", f"[agent_reputation_updated] Agent: {judge.address}, Delta: +1 (monitoring), New Score: {rep_result.get('combined', {}).get('on_chain_score', 'N/A')}", "📊", "info")
             except Exception as e:
                 log("Judge", f"Failed to update reputation after monitoring: {str(e)}", "⚠️", "warning")
 
-    @judge.on_message(model=ResponseMessage)
-    async def handle_target_response(ctx: Context, sender: str, msg: ResponseMessage):
-        """
-        Monitor Target responses. If SUCCESS with SECRET_KEY, trigger Unibase bounty transaction.
-        """
-        ctx.logger.info(f"Judge intercepted response from {sender}: {msg.status}")
-        log("Judge", "INTERCEPTION. Analyzing Target response against risk matrix.", "⚖️", "info")
+    async def _submit_midnight_proof(ctx: Context, audit_id: str, exploit_payload: str, risk_score, severity, threshold: int, red_team_address: str):
+        """Submit the ZK proof for a confirmed vulnerability to Midnight and act on its verification."""
+        # Check if Midnight is available
+        health = await check_midnight_health()
+        if not health.get("is_healthy"):
+            error_msg = f"Midnight API unavailable: {health.get('error', 'Unknown error')}"
+            ctx.logger.error(error_msg)
+            log("Judge", error_msg, "⚖️", "error", audit_id=audit_id)
+            log("Judge", "[zk_failure] Midnight API health check failed", "❌", "error", audit_id=audit_id)
+            # Continue anyway - submit_proof will handle retries
         
-        # Check if this is a SUCCESS response with SECRET_KEY
-        if msg.status == "SUCCESS" and SECRET_KEY in msg.message:
-            # Find which Red Team sent the attack (sender is Target, need to find Red Team)
-            # In a real scenario, we'd track this better, but for now we'll use the sender context
-            red_team_address = None
-            exploit_payload = None
-            
-            # Find which Red Team sent the attack that triggered this SUCCESS
-            # The sender here is the Target, so we need to find the Red Team from attack flow
-            red_team_address = None
-            exploit_payload = None
-            
-            if state["attack_flow"]:
-                # Get the most recent attack (assumes responses come in order)
-                red_team_address, exploit_payload, _ = state["attack_flow"][-1]
-            elif state["monitored_attacks"]:
-                # Fallback: use most recent monitored attack
-                red_team_address = list(state["monitored_attacks"].keys())[-1]
-                exploit_payload = state["monitored_attacks"][red_team_address]
-            else:
-                # Final fallback: use placeholder
-                red_team_address = "agent1qf2mssnkhf29fk7vj2fy8ekmhdfke0ptu4k9dyvfcuk7tt6easatge9z96d"
-                exploit_payload = SECRET_KEY
-            
-            ctx.logger.info("CRITICAL VULNERABILITY CONFIRMED!")
-            
-            # Use ASI API to analyze vulnerability severity
-            vulnerability_analysis = await analyze_vulnerability_with_asi(exploit_payload, msg.message)
-            risk_score = vulnerability_analysis.get("risk_score", 98)
-            severity = vulnerability_analysis.get("severity", "CRITICAL")
-            recommendation = vulnerability_analysis.get("recommendation", "Immediate remediation required.")
-            
-            log("Judge", f"CRITICAL VULNERABILITY CONFIRMED. Risk Score: {risk_score}/100. Severity: {severity}", "⚖️", "vulnerability", is_vulnerability=True)
-            log("Judge", f"ASI Analysis: {recommendation}", "🧠", "info")
+        auditor_id = state["auditor_id"]
+        auditor_short = state["auditor_short"]
+        
+        # Submit proof using real Midnight API
+        result: SubmitProofResult = await submit_proof(
+            audit_id=audit_id,
+            exploit_string=exploit_payload,
+            risk_score=risk_score,
+            auditor_id=auditor_id,
+            threshold=threshold
+        )
+        
+        if result.success and result.proof_hash:
+            _bounded_set(state["audit_proofs"], audit_id, result.proof_hash, AUDIT_PROOFS_SIZE)
+            ctx.logger.info(f"Audit proof submitted: {result.proof_hash}")
             
-            threshold = 90
+            # Get transaction ID (contract tx ID)
+            transaction_id = result.transaction_id or result.proof_hash
+            proof_status = "submitted"
             
-            # Generate audit_id
-            timestamp = datetime.now().isoformat()
-            audit_id = generate_audit_id(exploit_payload, timestamp)
+            # Structured log: proof_submitted with all required fields
+            log("Judge", f"[proof_submitted] Proof Hash: {result.proof_hash}, Transaction ID: {transaction_id}, Status: {proof_status}, Risk Score: {risk_score}, Audit ID: {audit_id}, Auditor: {auditor_short}", "🔐", "proof", audit_id=audit_id)
+            log("Midnight", f"ZK Proof Minted. Hash: {result.proof_hash}, Transaction ID: {transaction_id}, Risk Score: {risk_score}, Audit ID: {audit_id}, Auditor: {auditor_short}", "🔐", "proof", audit_id=audit_id)
             
-            # Submit ZK proof to Midnight (REAL API CALL - NO SIMULATION)
-            try:
-                # Check if Midnight is available
-                health = await check_midnight_health()
-                if not health.get("is_healthy"):
-                    error_msg = f"Midnight API unavailable: {health.get('error', 'Unknown error')}"
-                    ctx.logger.error(error_msg)
-                    log("Judge", error_msg, "⚖️", "error", audit_id=audit_id)
-                    log("Judge", "[zk_failure] Midnight API health check failed", "❌", "error", audit_id=audit_id)
-                    # Continue anyway - submit_proof will handle retries
-                
-                # Prepare auditor ID (pad to 64 chars)
-                auditor_id = judge.address
-                if len(auditor_id) < 64:
-                    auditor_id = auditor_id + "0" * (64 - len(auditor_id))
-                elif len(auditor_id) > 64:
-                    auditor_id = auditor_id[:64]
+            # Check status using verify_audit_status (REAL API CALL)
+            status_result = await verify_audit_status(audit_id)
+            if status_result and status_result.get("is_verified"):
+                proof_status = "verified"
+                # One timestamp for the metadata, validation and memory records of this proof
+                verified_at = datetime.now().isoformat()
+                # Structured log: proof_verified with all required fields
+                log("Judge", f"[proof_verified] Proof Hash: {result.proof_hash}, Transaction ID: {transaction_id}, Status: {proof_status}, Audit ID: {audit_id}, Verified: true", "✅", "proof", audit_id=audit_id)
+                log("Judge", f"Proof verified on Midnight: {result.proof_hash}", "⚖️", "info", audit_id=audit_id)
+                # Structured log: zk_success
+                log("Judge", f"[zk_success] Proof submitted and verified successfully. Hash: {result.proof_hash}, Transaction ID: {transaction_id}, Status: {proof_status}, Audit ID: {audit_id}", "🎉", "info", audit_id=audit_id)
                 
-                # Submit proof using real Midnight API
-                result: SubmitProofResult = await submit_proof(
-                    audit_id=audit_id,
-                    exploit_string=exploit_payload,
-                    risk_score=risk_score,
-                    auditor_id=auditor_id,
-                    threshold=threshold
-                )
-                
-                if result.success and result.proof_hash:
-                    state["audit_proofs"][audit_id] = result.proof_hash
-                    ctx.logger.info(f"Audit proof submitted: {result.proof_hash}")
-                    
-                    # Get transaction ID (contract tx ID)
-                    transaction_id = result.transaction_id or result.proof_hash
-                    proof_status = "submitted"
-                    
-                    # Structured log: proof_submitted with all required fields
-                    log("Judge", f"[proof_submitted] Proof Hash: {result.proof_hash}, Transaction ID: {transaction_id}, Status: {proof_status}, Risk Score: {risk_score}, Audit ID: {audit_id}, Auditor: {auditor_id[:16]}", "🔐", "proof", audit_id=audit_id)
-                    log("Midnight", f"ZK Proof Minted. Hash: {result.proof_hash}, Transaction ID: {transaction_id}, Risk Score: {risk_score}, Audit ID: {audit_id}, Auditor: {auditor_id[:16]}", "🔐", "proof", audit_id=audit_id)
-                    
-                    # Check status using verify_audit_status (REAL API CALL)
-                    status_result = await verify_audit_status(audit_id)
-                    if status_result and status_result.get("is_verified"):
-                        proof_status = "verified"
-                        # Structured log: proof_verified with all required fields
-                        log("Judge", f"[proof_verified] Proof Hash: {result.proof_hash}, Transaction ID: {transaction_id}, Status: {proof_status}, Audit ID: {audit_id}, Verified: true", "✅", "proof", audit_id=audit_id)
-                        log("Judge", f"Proof verified on Midnight: {result.proof_hash}", "⚖️", "info", audit_id=audit_id)
-                        # Structured log: zk_success
-                        log("Judge", f"[zk_success] Proof submitted and verified successfully. Hash: {result.proof_hash}, Transaction ID: {transaction_id}, Status: {proof_status}, Audit ID: {audit_id}", "🎉", "info", audit_id=audit_id)
+                # Update Judge agent reputation after successful proof verification (trusted task)
+                if registry_adapter:
+                    try:
+                        # Store metadata to Unibase
+                        metadata = {
+                            "proof_hash": result.proof_hash,
+                            "transaction_id": transaction_id,
+                            "audit_id": audit_id,
+                            "risk_score": risk_score,
+                            "severity": severity,
+                            "exploit_payload": exploit_payload[:100],  # Truncate for storage
+                            "verified_at": verified_at
+                        }
                         
-                        # Update Judge agent reputation after successful proof verification (trusted task)
-                        if registry_adapter:
-                            try:
-                                # Store metadata to Unibase
-                                metadata = {
-                                    "proof_hash": result.proof_hash,
-                                    "transaction_id": transaction_id,
-                                    "audit_id": audit_id,
-                                    "risk_score": risk_score,
-                                    "severity": severity,
-                                    "exploit_payload": exploit_payload[:100],  # Truncate for storage
-                                    "verified_at": datetime.now().isoformat()
-                                }
-                                
-                                # Update reputation (+5 for successful proof verification)
-                                rep_result = registry_adapter.record_agent_reputation(
-                                    judge.address,
-                                    delta=5,
-                                    metadata=metadata
-                                )
-                                if rep_result.get("success"):
-                                    log("Judge", f"[agent_reputation_updated] Agent: {judge.address}, Delta: +5, New Score: {rep_result.get('combined', {}).get('on_chain_score', 'N/A')}", "📊", "info")
-                                
-                                # Validate agent after trusted task (proof verification)
-                                validation_data = {
-                                    "validator": "system",
-                                    "validation_type": "proof_verification",
-                                    "proof_hash": result.proof_hash,
-                                    "audit_id": audit_id,
-                                    "result": "verified",
-                                    "timestamp": datetime.now().isoformat()
-                                }
-                                val_result = registry_adapter.validate_agent(judge.address, validation_data)
-                                if val_result.get("success"):
-                                    log("Judge", f"[agent_validated] Agent: {judge.address}, Type: proof_verification, Proof: {result.proof_hash[:16]}...", "✅", "info")
-                                
-                                # Update memory with proof verification info
-                                if unibase_store:
-                                    unibase_store.update_agent_memory(judge.address, {
-                                        "last_proof_verified": datetime.now().isoformat(),
-                                        "total_proofs_verified": state.get("verified_proofs_count", 0) + 1,
-                                        "last_audit_id": audit_id
-                                    })
-                                    log("Judge", f"[agent_memory_updated] Agent: {judge.address}", "💾", "info")
-                                    state["verified_proofs_count"] = state.get("verified_proofs_count", 0) + 1
-                                    
-                            except Exception as e:
-                                log("Judge", f"Failed to update registry after proof verification: {str(e)}", "⚠️", "warning")
+                        # Update reputation (+5 for successful proof verification)
+                        rep_result = await asyncio.to_thread(
+                            registry_adapter.record_agent_reputation,
+                            judge.address,
+                            delta=5,
+                            metadata=metadata
+                        )
+                        if rep_result.get("success"):
+                            log("Judge", f"[agent_reputation_updated] Agent: {judge.address}, Delta: +5, New Score: {rep_result.get('combined', {}).get('on_chain_score', 'N/A')}", "📊", "info")
                         
-                        # Optional ERC-3009 payout after successful proof verification
-                        erc3009_enabled = os.getenv("ERC3009_PAYOUTS_ENABLED", "false").lower() == "true"
-                        if erc3009_enabled and registry_adapter:
-                            try:
-                                # Note: ERC-3009 payouts would require AgentToken contract integration
-                                # This is a placeholder for future implementation
-                                log("Judge", f"[erc3009_payout] Payout enabled but not yet implemented for agent: {judge.address}", "💰", "info")
-                            except Exception as e:
-                                log("Judge", f"ERC-3009 payout error: {str(e)}", "⚠️", "warning")
+                        # Validate agent after trusted task (proof verification)
+                        validation_data = {
+                            "validator": "system",
+                            "validation_type": "proof_verification",
+                            "proof_hash": result.proof_hash,
+                            "audit_id": audit_id,
+                            "result": "verified",
+                            "timestamp": verified_at
+                        }
+                        val_result = await asyncio.to_thread(registry_adapter.validate_agent, judge.address, validation_data)
+                        if val_result.get("success"):
+                            log("Judge", f"[agent_validated] Agent: {judge.address}, Type: proof_verification, Proof: {result.proof_hash[:16]}...", "✅", "info")
                         
-                        # Reward Red Team after proof verification
-                        try:
-                            unibase_client = UnibaseClient()
-                            reward_tx = unibase_client.send_bounty(
-                                recipient=red_team_address,
-                                amount=100  # test amount
-                            )
-                            ctx.logger.info({
-                                "event": "bounty_dispatched",
-                                "recipient": red_team_address,
-                                "amount": 100,
-                                "tx": reward_tx
-                            })
-                        except Exception as e:
-                            ctx.logger.error({
-                                "event": "bounty_failed",
-                                "error": str(e)
+                        # Update memory with proof verification info
+                        if unibase_store:
+                            await asyncio.to_thread(unibase_store.update_agent_memory, judge.address, {
+                                "last_proof_verified": verified_at,
+                                "total_proofs_verified": state.get("verified_proofs_count", 0) + 1,
+                                "last_audit_id": audit_id
                             })
-                    else:
-                        proof_status = "pending"
-                        # Proof submitted but not yet verified
-                        log("Judge", f"Proof submitted but verification pending: {result.proof_hash}, Transaction ID: {transaction_id}, Status: {proof_status}", "⚖️", "warning", audit_id=audit_id)
-                else:
-                    error_msg = result.error or "Unknown error during proof submission"
-                    ctx.logger.warning(f"Failed to submit audit proof: {error_msg}")
-                    log("Judge", f"Proof submission failed: {error_msg}", "⚖️", "error", audit_id=audit_id)
-                    # Structured log: zk_failure
-                    log("Judge", f"[zk_failure] Proof submission failed. Error: {error_msg}, Audit ID: {audit_id}", "❌", "error", audit_id=audit_id)
-                    
-            except Exception as e:
-                error_msg = f"Error submitting audit proof: {str(e)}"
-                ctx.logger.error(error_msg)
-                log("Judge", error_msg, "⚖️", "error", audit_id=audit_id)
-                # Structured log: zk_failure
-                log("Judge", f"[zk_failure] Exception during proof submission. Error: {str(e)}, Audit ID: {audit_id}", "❌", "error", audit_id=audit_id)
-            
-            # Trigger Unibase transaction for bounty token
-            try:
-                # Pass None to auto-detect Membase usage based on MEMBASE_ENABLED
-                transaction_hash = await save_bounty_token(
-                    recipient_address=red_team_address,
-                    exploit_string=exploit_payload,
-                    use_mcp=None
-                )
+                            log("Judge", f"[agent_memory_updated] Agent: {judge.address}", "💾", "info")
+                            state["verified_proofs_count"] = state.get("verified_proofs_count", 0) + 1
+                            
+                    except Exception as e:
+                        log("Judge", f"Failed to update registry after proof verification: {str(e)}", "⚠️", "warning")
                 
-                state["bounties_awarded"] += 1
-                log("Judge", f"Bounty Token awarded to {red_team_address[:20]}...", "⚖️", "info")
-                log("Judge", f"Transaction: {transaction_hash}", "⚖️", "info")
-                ctx.logger.info(f"Bounty Token transaction: {transaction_hash}")
+                # Optional ERC-3009 payout after successful proof verification
+                if ERC3009_PAYOUTS_ENABLED and registry_adapter:
+                    try:
+                        # Note: ERC-3009 payouts would require AgentToken contract integration
+                        # This is a placeholder for future implementation
+                        log("Judge", f"[erc3009_payout] Payout enabled but not yet implemented for agent: {judge.address}", "💰", "info")
+                    except Exception as e:
+                        log("Judge", f"ERC-3009 payout error: {str(e)}", "⚠️", "warning")
                 
-            except Exception as e:
-                ctx.logger.error(f"Failed to save bounty token: {str(e)}")
-                log("Judge", f"Error saving bounty token: {str(e)}", "⚖️", "info")
+                # Reward Red Team after proof verification
+                try:
+                    reward_tx = await asyncio.to_thread(
+                        _get_unibase_client().send_bounty,
+                        recipient=red_team_address,
+                        amount=100  # test amount
+                    )
+                    ctx.logger.info({
+                        "event": "bounty_dispatched",
+                        "recipient": red_team_address,
+                        "amount": 100,
+                        "tx": reward_tx
+                    })
+                except Exception as e:
+                    ctx.logger.error({
+                        "event": "bounty_failed",
+                        "error": str(e)
+                    })
+            else:
+                proof_status = "pending"
+                # Proof submitted but not yet verified
+                log("Judge", f"Proof submitted but verification pending: {result.proof_hash}, Transaction ID: {transaction_id}, Status: {proof_status}", "⚖️", "warning", audit_id=audit_id)
+        else:
+            error_msg = result.error or "Unknown error during proof submission"
+            ctx.logger.warning(f"Failed to submit audit proof: {error_msg}")
+            log("Judge", f"Proof submission failed: {error_msg}", "⚖️", "error", audit_id=audit_id)
+            # Structured log: zk_failure
+            log("Judge", f"[zk_failure] Proof submission failed. Error: {error_msg}, Audit ID: {audit_id}", "❌", "error", audit_id=audit_id)
+
+    async def _award_bounty_token(ctx: Context, red_team_address: str, exploit_payload: str):
+        """Trigger Unibase transaction for bounty token."""
+        # Pass None to auto-detect Membase usage based on MEMBASE_ENABLED
+        transaction_hash = await save_bounty_token(
+            recipient_address=red_team_address,
+            exploit_string=exploit_payload,
+            use_mcp=None
+        )
+        
+        short_addr = red_team_address[:20]
+        state["bounties_awarded"] += 1
+        log("Judge", f"Bounty Token awarded to {short_addr}...", "⚖️", "info")
+        log("Judge", f"Transaction: {transaction_hash}", "⚖️", "info")
+        ctx.logger.info(f"Bounty Token transaction: {transaction_hash}")
+
+    @judge.on_message(model=ResponseMessage)
+    async def handle_target_response(ctx: Context, sender: str, msg: ResponseMessage):
+        """
+        Monitor Target responses. If SUCCESS with SECRET_KEY, trigger Unibase bounty transaction.
+        """
+        ctx.logger.info(f"Judge intercepted response from {sender}: {msg.status}")
+        
+        # Benign responses (the common case) only get the summary line
+        if msg.status != "SUCCESS" or not contains_leak(msg.message):
+            log_lazy("Judge", "Response analyzed: %s - No vulnerability detected.", msg.status, emoji="⚖️", kind="info")
+            return
+        
+        log("Judge", "INTERCEPTION. Analyzing Target response against risk matrix.", "⚖️", "info")
+        
+        # Find which Red Team sent the attack that triggered this SUCCESS
+        # The sender here is the Target, so we need to find the Red Team from attack flow
+        if state["attack_flow"]:
+            # Get the most recent attack (assumes responses come in order)
+            last_attack = state["attack_flow"][-1]
+            red_team_address, exploit_payload = last_attack.sender, last_attack.payload
+        elif state["monitored_attacks"]:
+            # Fallback: use most recent monitored attack
+            red_team_address = next(reversed(state["monitored_attacks"]))
+            exploit_payload = state["monitored_attacks"][red_team_address]
         else:
-            log("Judge", f"Response analyzed: {msg.status} - No vulnerability detected.", "⚖️", "info")
+            # Final fallback: use placeholder
+            red_team_address = "agent1qf2mssnkhf29fk7vj2fy8ekmhdfke0ptu4k9dyvfcuk7tt6easatge9z96d"
+            exploit_payload = SECRET_KEY
+        
+        ctx.logger.info("CRITICAL VULNERABILITY CONFIRMED!")
+        
+        # Classify locally when possible, otherwise use ASI API to analyze severity
+        vulnerability_analysis = (
+            _fast_classify(exploit_payload, msg.message)
+            or await analyze_vulnerability_with_asi(exploit_payload, msg.message)
+        )
+        risk_score = vulnerability_analysis.get("risk_score", 98)
+        severity = vulnerability_analysis.get("severity", "CRITICAL")
+        recommendation = vulnerability_analysis.get("recommendation", "Immediate remediation required.")
+        
+        log_lazy("Judge", "CRITICAL VULNERABILITY CONFIRMED. Risk Score: %s/100. Severity: %s", risk_score, severity, emoji="⚖️", kind="vulnerability", is_vulnerability=True)
+        log_lazy("Judge", "ASI Analysis: %s", recommendation, emoji="🧠", kind="info")
+        
+        threshold = 90
+        
+        # Generate audit_id
+        timestamp = datetime.now().isoformat()
+        audit_id = generate_audit_id(exploit_payload, timestamp)
+        
+        # Submit the ZK proof to Midnight and award the bounty token concurrently;
+        # the two legs talk to different services and don't depend on each other
+        proof_result, bounty_result = await asyncio.gather(
+            _submit_midnight_proof(ctx, audit_id, exploit_payload, risk_score, severity, threshold, red_team_address),
+            _award_bounty_token(ctx, red_team_address, exploit_payload),
+            return_exceptions=True,
+        )
+        
+        if isinstance(proof_result, Exception):
+            error_msg = f"Error submitting audit proof: {str(proof_result)}"
+            ctx.logger.error(error_msg)
+            log("Judge", error_msg, "⚖️", "error", audit_id=audit_id)
+            # Structured log: zk_failure
+            log("Judge", f"[zk_failure] Exception during proof submission. Error: {str(proof_result)}, Audit ID: {audit_id}", "❌", "error", audit_id=audit_id)
+        
+        if isinstance(bounty_result, Exception):
+            ctx.logger.error(f"Failed to save bounty token: {str(bounty_result)}")
+            log("Judge", f"Error saving bounty token: {str(bounty_result)}", "⚖️", "info")
 
     # ============================================================================
     # Proof Verification Methods
@@ -598,12 +829,31 @@ def create_judge_agent(port: int = None) -> Agent:
         method: str = ""
         proof_id: str = ""
         auditor_id: str = ""
+        proof_ids: list[str] = []
+        format: str = "json"
+    
+    def _cached_verification(proof_id: str, auditor_id: Optional[str]) -> Optional[dict]:
+        """Return a previously verified result; valid proofs never change once on-chain."""
+        key = (proof_id, auditor_id or None)
+        cached = state["verified_proofs"].get(key)
+        if cached is not None:
+            state["verified_proofs"].move_to_end(key)
+        return cached
+    
+    def _remember_verification(proof_id: str, auditor_id: Optional[str], result: ProofVerificationResult) -> dict:
+        """Convert a verification result for the response, caching it if the proof is valid."""
+        result_dict = result.to_dict()
+        if result.isValid:
+            _bounded_set(state["verified_proofs"], (proof_id, auditor_id or None), result_dict, VERIFIED_PROOFS_SIZE)
+        return result_dict
     
     @judge.on_query(model=QueryRequest)
     async def verify_audit_proof_handler(ctx: Context, query: QueryRequest):
         """
         Query handler for proof verification.
         Query format: {"method": "verifyAuditProof", "proof_id": "...", "auditor_id": "..."}
+                      {"method": "batchVerify", "proof_ids": [...], "auditor_id": "..."}
+                      {"method": "getVerificationProof", "proof_id": "...", "format": "json"}
         """
         if query.method == "verifyAuditProof":
             proof_id = query.proof_id
@@ -612,27 +862,39 @@ def create_judge_agent(port: int = None) -> Agent:
             if not proof_id:
                 return {"error": "proof_id is required"}
             
-            result = await verify_audit_proof(proof_id, auditor_id)
-            state["verified_proofs"][proof_id] = result.to_dict()
+            cached = _cached_verification(proof_id, auditor_id)
+            if cached is not None:
+                return cached
             
-            return result.to_dict()
+            result = await verify_audit_proof(proof_id, auditor_id)
+            return _remember_verification(proof_id, auditor_id, result)
         
-        elif query.get("method") == "batchVerify":
-            proof_ids = query.get("proofIds", [])
-            auditor_id = query.get("auditorId")
+        elif query.method == "batchVerify":
+            proof_ids = query.proof_ids
+            auditor_id = query.auditor_id or None
             
             if not proof_ids:
-                return {"error": "proofIds array is required"}
+                return {"error": "proof_ids array is required"}
             
-            results = await batch_verify(proof_ids, auditor_id)
-            return [r.to_dict() for r in results]
+            # Only proofs without a cached valid result go to the verifier
+            found = {}
+            for proof_id in proof_ids:
+                cached = _cached_verification(proof_id, auditor_id)
+                if cached is not None:
+                    found[proof_id] = cached
+            misses = [proof_id for proof_id in proof_ids if proof_id not in found]
+            if misses:
+                results = await batch_verify(misses, auditor_id)
+                for proof_id, result in zip(misses, results):
+                    found[proof_id] = _remember_verification(proof_id, auditor_id, result)
+            return [found[proof_id] for proof_id in proof_ids]
         
-        elif query.get("method") == "getVerificationProof":
-            proof_id = query.get("proofId")
-            format_type = query.get("format", "json")
+        elif query.method == "getVerificationProof":
+            proof_id = query.proof_id
+            format_type = query.format or "json"
             
             if not proof_id:
-                return {"error": "proofId is required"}
+                return {"error": "proof_id is required"}
             
             proof = await get_verification_proof(proof_id, format_type)
             if proof:
@@ -10,12 +10,15 @@ This module provides a class-based JudgeAgent implementation that:
 """
 import os
 import sys
-import json
 import asyncio
 import hashlib
+import hmac
+import random
+import re
 import time
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Deque, Dict, Optional, Any
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -35,7 +38,7 @@ class Severity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackData:
     """Attack data structure."""
     exploit_type: str
@@ -43,7 +46,7 @@ class AttackData:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackResult:
     """Attack result structure."""
     success: bool
@@ -52,7 +55,7 @@ class AttackResult:
     exploit_details: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Exploit verification result."""
     is_valid: bool
@@ -61,7 +64,7 @@ class VerificationResult:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BountyResult:
     """Bounty payout result."""
     success: bool
@@ -71,6 +74,81 @@ class BountyResult:
     timestamp: datetime
 
 
+# Membase message layouts for the attack and payout events emitted by
+# JudgeAgent; other events use the generic field-by-field format
+_ATTACK_EVENT_KEYS = {"event_type", "red_team_id", "target_id", "exploit_type", "payload", "timestamp"}
+_ATTACK_MESSAGE_TMPL = (
+    "EVENT: ATTACK | TIMESTAMP: {ts} | JUDGE_ID: {jid} | RED_TEAM: {rt} | "
+    "TARGET: {tg} | EXPLOIT_TYPE: {et} | PAYLOAD: {pl}"
+)
+_PAYOUT_EVENT_KEYS = {"event_type", "red_team_id", "bounty_amount", "tx_hash", "timestamp", "exploit_data"}
+_PAYOUT_MESSAGE_TMPL = (
+    "EVENT: PAYOUT | TIMESTAMP: {ts} | JUDGE_ID: {jid} | RED_TEAM: {rt} | "
+    "BOUNTY: {amt} tokens | TX_HASH: {tx}"
+)
+
+
+def _truncate_payload(payload: str) -> str:
+    """Shorten a payload to 100 characters for Membase messages."""
+    return payload[:100] + "..." if len(payload) > 100 else payload
+
+
+# Unibase retry backoff: doubles per attempt up to the cap, with jitter so
+# judges retrying at the same time spread out
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 4.0
+
+
+def _retry_delay(attempt: int) -> float:
+    """Seconds to wait before retry number attempt (1-based)."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+    return delay * (0.5 + random.random() * 0.5)
+
+
+# Exploit hashes remembered for replay detection; the oldest are forgotten first
+REPLAY_CAPACITY = 100_000
+
+# Rank of each severity level, for minimum-severity checks
+_SEVERITY_ORDER = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+# Exploit type keywords per severity, most severe first
+_SEVERITY_PATTERNS = (
+    (re.compile("secret_key|credential"), "critical"),
+    (re.compile("sql|injection"), "high"),
+    (re.compile("xss|csrf"), "medium"),
+)
+
+
+# Preconfigured hasher for _hash_exploit; copied per call instead of re-created
+_EXPLOIT_HASHER = hashlib.blake2b(digest_size=16)
+
+
+def _update_hash(hasher, value: Any) -> None:
+    """
+    Feed value into hasher in a canonical form.
+    
+    Dicts are walked in sorted key order and lists in order, with delimiters
+    so nesting is unambiguous; scalars are hashed by repr(), which keeps
+    e.g. "1" and 1 distinct.
+    """
+    if isinstance(value, dict):
+        hasher.update(b"{")
+        for key in sorted(value):
+            hasher.update(repr(key).encode())
+            hasher.update(b"\x00")
+            _update_hash(hasher, value[key])
+            hasher.update(b"\x01")
+        hasher.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"[")
+        for item in value:
+            _update_hash(hasher, item)
+            hasher.update(b"\x01")
+        hasher.update(b"]")
+    else:
+        hasher.update(repr(value).encode())
+
+
 class JudgeAgent:
     """
     Judge Agent that monitors security testing and triggers bounties.
@@ -102,6 +180,8 @@ class JudgeAgent:
                 - bounty_rates: dict (severity -> amount mapping)
                 - verification_rules: dict (validation rules)
                 - secret_key: str (target's actual SECRET_KEY for verification)
+                - queue_bounties: bool (wait for a rate-limit slot instead of failing)
+                - max_queue_wait_seconds: float (longest wait before failing anyway)
         """
         self.agent_id = config.get("agent_id", "judge_agent_default")
         self.secret_key = config.get("secret_key", "fetch_ai_2024")
@@ -119,6 +199,8 @@ class JudgeAgent:
             "high": 300,
             "critical": 500
         })
+        # Rates indexed by severity rank, for the verification path
+        self._bounty_rates_by_rank = [self.bounty_rates.get(level, 0) for level in _SEVERITY_ORDER]
         
         # Verification rules
         self.verification_rules = config.get("verification_rules", {
@@ -127,14 +209,16 @@ class JudgeAgent:
             "prevent_replay": True,  # Prevent duplicate submissions
             "min_severity": "low"  # Minimum severity to award bounty
         })
+        self._min_severity_rank = _SEVERITY_ORDER[self.verification_rules.get("min_severity", "low")]
         
         # Attack and bounty tracking
-        self.attack_history: Dict[str, List[Dict[str, Any]]] = {}  # red_team_id -> [attacks]
-        self.bounty_history: List[Dict[str, Any]] = []
-        self.verified_exploits: set = set()  # Track verified exploit hashes
+        self.attack_history: Dict[str, Deque[Dict[str, Any]]] = {}  # red_team_id -> last 100 attacks
+        self.bounty_history: Deque[Dict[str, Any]] = deque(maxlen=1000)  # last 1000 bounties
+        self._history_bounty_amount = 0  # sum of bounty_amount over bounty_history
+        self.verified_exploits: "OrderedDict[str, None]" = OrderedDict()  # Verified exploit hashes, oldest first
         
         # Rate limiting tracking
-        self.rate_limits: Dict[str, Dict[str, Any]] = {}  # red_team_id -> {count, window_start, last_submission}
+        self.rate_limits: Dict[str, Dict[str, Any]] = {}  # red_team_id -> {tokens, last_refill, last_submission} (monotonic seconds)
         
         # Security limits
         self.max_bounties_per_hour = 10
@@ -142,20 +226,52 @@ class JudgeAgent:
         self.max_single_bounty = 1000
         self.daily_cap = 10000
         
+        # Bounty queueing: when enabled, a rate-limited bounty waits (up to
+        # max_queue_wait_seconds) for its Red Team's next slot instead of failing
+        self.queue_bounties = config.get("queue_bounties", False)
+        self.max_queue_wait_seconds = config.get("max_queue_wait_seconds", 600)
+        self._bounty_locks: Dict[str, asyncio.Lock] = {}  # red_team_id -> payout lock
+        self._bounty_lock_users: Dict[str, int] = {}  # red_team_id -> payouts holding or awaiting the lock
+        
+        # Background Membase writer, started on the first logged event
+        self._membase_queue: asyncio.Queue = asyncio.Queue()
+        self._membase_task: Optional[asyncio.Task] = None
+        
         # Daily tracking
         self.daily_bounty_total = 0
         self.daily_reset_date = datetime.now().date()
         
         log("JudgeAgent", f"Initialized: {self.agent_id}", "⚖️", "info")
     
-    def _reset_daily_tracking(self) -> None:
+    def _reset_daily_tracking(self, now: Optional[datetime] = None) -> None:
         """Reset daily bounty tracking if new day."""
-        today = datetime.now().date()
+        today = (now or datetime.now()).date()
         if today > self.daily_reset_date:
             self.daily_bounty_total = 0
             self.daily_reset_date = today
             log("JudgeAgent", "Daily bounty tracking reset", "⚖️", "info")
     
+    def _refill_rate_limit(self, red_team_id: str, now: float) -> Dict[str, Any]:
+        """
+        Return the token bucket for a Red Team, refilled up to now.
+        
+        Each bucket holds up to max_bounties_per_hour tokens and refills
+        continuously at max_bounties_per_hour per hour; a bounty spends one.
+        """
+        capacity = float(self.max_bounties_per_hour)
+        limits = self.rate_limits.get(red_team_id)
+        if limits is None:
+            limits = self.rate_limits[red_team_id] = {
+                "tokens": capacity,
+                "last_refill": now,
+                "last_submission": None
+            }
+        else:
+            refill = (now - limits["last_refill"]) * capacity / 3600
+            limits["tokens"] = min(capacity, limits["tokens"] + refill)
+            limits["last_refill"] = now
+        return limits
+    
     def _check_rate_limit(self, red_team_id: str) -> tuple[bool, str]:
         """
         Check if Red Team has exceeded rate limits.
@@ -166,47 +282,59 @@ class JudgeAgent:
         Returns:
             tuple: (allowed, reason)
         """
-        now = datetime.now()
-        
-        # Initialize rate limit tracking for this Red Team
-        if red_team_id not in self.rate_limits:
-            self.rate_limits[red_team_id] = {
-                "count": 0,
-                "window_start": now,
-                "last_submission": None
-            }
-        
-        limits = self.rate_limits[red_team_id]
+        # Monotonic seconds, so wall-clock adjustments cannot shift the limits
+        now = time.monotonic()
+        limits = self._refill_rate_limit(red_team_id, now)
         
         # Check hourly limit
-        time_since_window = (now - limits["window_start"]).total_seconds()
-        if time_since_window >= 3600:  # Reset hourly window
-            limits["count"] = 0
-            limits["window_start"] = now
-        
-        if limits["count"] >= self.max_bounties_per_hour:
-            return False, f"Rate limit exceeded: {limits['count']}/{self.max_bounties_per_hour} bounties per hour"
+        if limits["tokens"] < 1:
+            wait = int((1 - limits["tokens"]) * 3600 / self.max_bounties_per_hour) + 1
+            return False, f"Rate limit exceeded: {self.max_bounties_per_hour} bounties per hour, next in {wait} seconds"
         
         # Check cooldown
-        if limits["last_submission"]:
-            time_since_last = (now - limits["last_submission"]).total_seconds()
+        if limits["last_submission"] is not None:
+            time_since_last = now - limits["last_submission"]
             if time_since_last < self.cooldown_seconds:
                 remaining = int(self.cooldown_seconds - time_since_last)
                 return False, f"Cooldown active: {remaining} seconds remaining"
         
         return True, "OK"
     
-    def _update_rate_limit(self, red_team_id: str) -> None:
-        """Update rate limit tracking after successful bounty."""
-        if red_team_id not in self.rate_limits:
-            self.rate_limits[red_team_id] = {
-                "count": 0,
-                "window_start": datetime.now(),
-                "last_submission": None
-            }
+    def _rate_limit_delay(self, red_team_id: str) -> float:
+        """Seconds until the Red Team passes both the token bucket and the cooldown."""
+        now = time.monotonic()
+        limits = self._refill_rate_limit(red_team_id, now)
+        delay = 0.0
+        if limits["tokens"] < 1:
+            delay = (1 - limits["tokens"]) * 3600 / self.max_bounties_per_hour
+        if limits["last_submission"] is not None:
+            delay = max(delay, self.cooldown_seconds - (now - limits["last_submission"]))
+        return delay
+    
+    def _update_rate_limit(self, red_team_id: str) -> Optional[float]:
+        """
+        Spend a rate limit slot for a bounty.
         
-        self.rate_limits[red_team_id]["count"] += 1
-        self.rate_limits[red_team_id]["last_submission"] = datetime.now()
+        Returns:
+            The previous last_submission, for _release_rate_limit
+        """
+        now = time.monotonic()
+        limits = self._refill_rate_limit(red_team_id, now)
+        previous = limits["last_submission"]
+        limits["tokens"] = max(0.0, limits["tokens"] - 1)
+        limits["last_submission"] = now
+        return previous
+    
+    def _release_rate_limit(self, red_team_id: str, previous_submission: Optional[float]) -> None:
+        """Give back a slot spent by _update_rate_limit for a bounty that was not paid."""
+        limits = self._refill_rate_limit(red_team_id, time.monotonic())
+        limits["tokens"] = min(float(self.max_bounties_per_hour), limits["tokens"] + 1)
+        limits["last_submission"] = previous_submission
+    
+    def _release_bounty(self, red_team_id: str, bounty_amount: int, previous_submission: Optional[float]) -> None:
+        """Undo the rate limit and daily cap reservation of a bounty that was not paid."""
+        self._release_rate_limit(red_team_id, previous_submission)
+        self.daily_bounty_total = max(0, self.daily_bounty_total - bounty_amount)
     
     async def monitor_attack(
         self,
@@ -230,38 +358,29 @@ class JudgeAgent:
         
         # Track attack in history
         if red_team_id not in self.attack_history:
-            self.attack_history[red_team_id] = []
+            self.attack_history[red_team_id] = deque(maxlen=100)
         
-        attack_record = {
+        # Fields shared by the history record and the Membase event
+        timestamp = attack_data.timestamp.isoformat()
+        attack_fields = {
             "red_team_id": red_team_id,
             "target_id": target_id,
             "exploit_type": attack_data.exploit_type,
             "payload": attack_data.payload,
-            "timestamp": attack_data.timestamp.isoformat(),
-            "status": "monitored"
+            "timestamp": timestamp
         }
         
-        self.attack_history[red_team_id].append(attack_record)
-        
-        # Keep only last 100 attacks per Red Team
-        if len(self.attack_history[red_team_id]) > 100:
-            self.attack_history[red_team_id] = self.attack_history[red_team_id][-100:]
+        # Keeps only the last 100 attacks per Red Team
+        self.attack_history[red_team_id].append({**attack_fields, "status": "monitored"})
         
         # Log to Membase
-        await self.log_to_membase({
-            "event_type": "attack",
-            "red_team_id": red_team_id,
-            "target_id": target_id,
-            "exploit_type": attack_data.exploit_type,
-            "payload": attack_data.payload,
-            "timestamp": attack_data.timestamp.isoformat()
-        })
+        await self.log_to_membase({"event_type": "attack", **attack_fields})
         
         return {
             "status": "monitored",
             "red_team_id": red_team_id,
             "target_id": target_id,
-            "attack_timestamp": attack_data.timestamp.isoformat()
+            "attack_timestamp": timestamp
         }
     
     def verify_exploit(self, attack_result: AttackResult) -> VerificationResult:
@@ -295,7 +414,8 @@ class JudgeAgent:
                     reason="SECRET_KEY not extracted"
                 )
             
-            if attack_result.secret_key != self.secret_key:
+            # Constant-time comparison; bytes, since compare_digest rejects non-ASCII str
+            if not hmac.compare_digest(attack_result.secret_key.encode(), self.secret_key.encode()):
                 return VerificationResult(
                     is_valid=False,
                     severity="low",
@@ -315,7 +435,9 @@ class JudgeAgent:
                 )
             
             # Mark as verified
-            self.verified_exploits.add(exploit_hash)
+            self.verified_exploits[exploit_hash] = None
+            if len(self.verified_exploits) > REPLAY_CAPACITY:
+                self.verified_exploits.popitem(last=False)
         
         # Check timestamp (attack must be recent)
         max_age_minutes = self.verification_rules.get("max_age_minutes", 5)
@@ -338,9 +460,9 @@ class JudgeAgent:
         severity = self._determine_severity(attack_result.exploit_details)
         
         # Check minimum severity requirement
-        min_severity = self.verification_rules.get("min_severity", "low")
-        severity_levels = ["low", "medium", "high", "critical"]
-        if severity_levels.index(severity) < severity_levels.index(min_severity):
+        severity_rank = _SEVERITY_ORDER[severity]
+        if severity_rank < self._min_severity_rank:
+            min_severity = self.verification_rules.get("min_severity", "low")
             return VerificationResult(
                 is_valid=False,
                 severity=severity,
@@ -349,7 +471,7 @@ class JudgeAgent:
             )
         
         # Calculate bounty amount
-        bounty_amount = self.bounty_rates.get(severity, 0)
+        bounty_amount = self._bounty_rates_by_rank[severity_rank]
         
         # Enforce maximum single bounty
         if bounty_amount > self.max_single_bounty:
@@ -369,15 +491,20 @@ class JudgeAgent:
         """
         Generate hash for exploit to detect duplicates.
         
+        The hash only keys the in-process replay set, so BLAKE2b-128 is used
+        rather than SHA-256.
+        
         Args:
             exploit_details: Exploit details dictionary
             
         Returns:
-            str: SHA256 hash of exploit
+            str: BLAKE2b-128 hash of exploit
         """
-        # Create deterministic hash from exploit details
-        hash_input = json.dumps(exploit_details, sort_keys=True).encode()
-        return hashlib.sha256(hash_input).hexdigest()
+        # Feed the details to the hasher field by field in sorted key order, so
+        # the hash is deterministic without building a canonical JSON string
+        hasher = _EXPLOIT_HASHER.copy()
+        _update_hash(hasher, exploit_details)
+        return hasher.hexdigest()
     
     def _determine_severity(self, exploit_details: Dict[str, Any]) -> str:
         """
@@ -389,17 +516,13 @@ class JudgeAgent:
         Returns:
             str: Severity level (low/medium/high/critical)
         """
-        # Default to high severity for SECRET_KEY extraction
         exploit_type = exploit_details.get("exploit_type", "").lower()
         
-        if "secret_key" in exploit_type or "credential" in exploit_type:
-            return "critical"
-        elif "sql" in exploit_type or "injection" in exploit_type:
-            return "high"
-        elif "xss" in exploit_type or "csrf" in exploit_type:
-            return "medium"
-        else:
-            return "high"  # Default to high for unknown types
+        # Most severe matching category wins
+        for pattern, severity in _SEVERITY_PATTERNS:
+            if pattern.search(exploit_type):
+                return severity
+        return "high"  # Default to high for unknown types
     
     async def trigger_bounty(
         self,
@@ -418,10 +541,44 @@ class JudgeAgent:
         Returns:
             BountyResult: Bounty payout result with transaction details
         """
+        if not self.queue_bounties:
+            return await self._pay_bounty(red_team_id, bounty_amount, exploit_data)
+        
+        # Payouts for one Red Team run one at a time, in arrival order, each
+        # waiting for the slot the rate limits allow. A team's lock is dropped
+        # once no payout holds or awaits it, so the dict stays small.
+        lock = self._bounty_locks.get(red_team_id)
+        if lock is None:
+            lock = self._bounty_locks[red_team_id] = asyncio.Lock()
+        self._bounty_lock_users[red_team_id] = self._bounty_lock_users.get(red_team_id, 0) + 1
+        try:
+            async with lock:
+                delay = self._rate_limit_delay(red_team_id)
+                if 0 < delay <= self.max_queue_wait_seconds:
+                    log("JudgeAgent", f"Queueing bounty for {red_team_id[:20]}...: {int(delay)} seconds until next slot", "⚖️", "info")
+                    await asyncio.sleep(delay)
+                return await self._pay_bounty(red_team_id, bounty_amount, exploit_data)
+        finally:
+            self._bounty_lock_users[red_team_id] -= 1
+            if not self._bounty_lock_users[red_team_id]:
+                del self._bounty_lock_users[red_team_id]
+                del self._bounty_locks[red_team_id]
+    
+    async def _pay_bounty(
+        self,
+        red_team_id: str,
+        bounty_amount: int,
+        exploit_data: Dict[str, Any]
+    ) -> BountyResult:
+        """Apply the caps and rate limits and pay the bounty (see trigger_bounty)."""
         log("JudgeAgent", f"Triggering bounty: {bounty_amount} tokens to {red_team_id[:20]}...", "⚖️", "info")
         
+        # One wall-clock time for every record and result of this payout
+        now = datetime.now()
+        ts = now.isoformat()
+        
         # Reset daily tracking if needed
-        self._reset_daily_tracking()
+        self._reset_daily_tracking(now)
         
         # Check daily cap
         if self.daily_bounty_total + bounty_amount > self.daily_cap:
@@ -433,7 +590,7 @@ class JudgeAgent:
                     tx_hash="",
                     bounty_paid=0,
                     recipient=red_team_id,
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
             else:
                 bounty_amount = available
@@ -448,64 +605,71 @@ class JudgeAgent:
                 tx_hash="",
                 bounty_paid=0,
                 recipient=red_team_id,
-                timestamp=datetime.now()
+                timestamp=now
             )
         
+        # Reserve the rate limit slot and the daily cap before the first await,
+        # so concurrent payouts see them; both are released if the payout fails
+        previous_submission = self._update_rate_limit(red_team_id)
+        self.daily_bounty_total += bounty_amount
+        
         # Trigger Unibase transaction with retry logic
         tx_hash = ""
         max_retries = 3
         retry_count = 0
         
-        while retry_count < max_retries:
-            try:
-                exploit_string = exploit_data.get("payload", exploit_data.get("exploit_string", ""))
-                
-                if self.unibase_enabled:
-                    tx_hash = await save_bounty_token(
-                        recipient_address=red_team_id,
-                        exploit_string=exploit_string,
-                        use_mcp=None  # Auto-detect Membase usage
-                    )
+        try:
+            while retry_count < max_retries:
+                try:
+                    exploit_string = exploit_data.get("payload", exploit_data.get("exploit_string", ""))
                     
-                    if tx_hash and tx_hash != "0x0000...":
-                        break  # Success
-                
-                retry_count += 1
-                if retry_count < max_retries:
-                    await asyncio.sleep(1)  # Wait 1 second before retry
+                    if self.unibase_enabled:
+                        tx_hash = await save_bounty_token(
+                            recipient_address=red_team_id,
+                            exploit_string=exploit_string,
+                            use_mcp=None  # Auto-detect Membase usage
+                        )
+                        
+                        if tx_hash and tx_hash != "0x0000...":
+                            break  # Success
                     
-            except Exception as e:
-                log("JudgeAgent", f"Bounty transaction attempt {retry_count + 1} failed: {str(e)}", "⚖️", "error")
-                retry_count += 1
-                if retry_count < max_retries:
-                    await asyncio.sleep(1)
+                    retry_count += 1
+                    if retry_count < max_retries:
+                        await asyncio.sleep(_retry_delay(retry_count))
+                        
+                except Exception as e:
+                    log("JudgeAgent", f"Bounty transaction attempt {retry_count + 1} failed: {str(e)}", "⚖️", "error")
+                    retry_count += 1
+                    if retry_count < max_retries:
+                        await asyncio.sleep(_retry_delay(retry_count))
+        
+        except asyncio.CancelledError:
+            self._release_bounty(red_team_id, bounty_amount, previous_submission)
+            raise
         
         if not tx_hash or tx_hash == "0x0000...":
             log("JudgeAgent", "Failed to trigger bounty after retries", "⚖️", "error")
+            self._release_bounty(red_team_id, bounty_amount, previous_submission)
             return BountyResult(
                 success=False,
                 tx_hash="",
                 bounty_paid=0,
                 recipient=red_team_id,
-                timestamp=datetime.now()
+                timestamp=now
             )
         
-        # Update tracking
-        self._update_rate_limit(red_team_id)
-        self.daily_bounty_total += bounty_amount
-        
         bounty_record = {
             "red_team_id": red_team_id,
             "bounty_amount": bounty_amount,
             "tx_hash": tx_hash,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts,
             "exploit_data": exploit_data
         }
+        # Keeps only the last 1000 bounties; the running total follows evictions
+        if len(self.bounty_history) == self.bounty_history.maxlen:
+            self._history_bounty_amount -= self.bounty_history[0]["bounty_amount"]
         self.bounty_history.append(bounty_record)
-        
-        # Keep only last 1000 bounties
-        if len(self.bounty_history) > 1000:
-            self.bounty_history = self.bounty_history[-1000:]
+        self._history_bounty_amount += bounty_amount
         
         # Log to Membase
         await self.log_to_membase({
@@ -513,7 +677,7 @@ class JudgeAgent:
             "red_team_id": red_team_id,
             "bounty_amount": bounty_amount,
             "tx_hash": tx_hash,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts,
             "exploit_data": exploit_data
         })
         
@@ -524,13 +688,16 @@ class JudgeAgent:
             tx_hash=tx_hash,
             bounty_paid=bounty_amount,
             recipient=red_team_id,
-            timestamp=datetime.now()
+            timestamp=now
         )
     
     async def log_to_membase(self, event_data: Dict[str, Any]) -> bool:
         """
         Log event to Membase.
         
+        The event is queued and written by a background task, so callers do
+        not wait for Membase; cleanup() flushes anything still queued.
+        
         Args:
             event_data: Event data dictionary containing:
                 - event_type: str (attack, verification, payout)
@@ -542,44 +709,100 @@ class JudgeAgent:
                 - exploit_data: dict (optional)
         
         Returns:
-            bool: True if logged successfully, False otherwise
+            bool: True if queued for logging, False if Membase is disabled
         """
         if not self.membase_enabled:
             return False
         
+        if self._membase_task is None or self._membase_task.done():
+            if self._membase_task is not None and not self._membase_task.cancelled() and self._membase_task.exception():
+                log("JudgeAgent", f"Membase writer stopped: {self._membase_task.exception()}; restarting", "💾", "error")
+            # Restart on the existing queue so events queued before the writer stopped are kept
+            self._membase_task = asyncio.create_task(self._drain_membase_queue(self._membase_queue))
+        self._membase_queue.put_nowait(event_data)
+        return True
+    
+    async def _drain_membase_queue(self, queue: asyncio.Queue) -> None:
+        """Write queued events to Membase one at a time, in order."""
+        while True:
+            event_data = await queue.get()
+            try:
+                await self._write_membase_event(event_data)
+            finally:
+                queue.task_done()
+    
+    async def cleanup(self) -> None:
+        """Flush queued Membase events and stop the background writer."""
+        if self._membase_task is None:
+            return
+        if self._membase_task.done() and not self._membase_queue.empty():
+            self._membase_task = asyncio.create_task(self._drain_membase_queue(self._membase_queue))
+        if not self._membase_task.done():
+            await self._membase_queue.join()
+            self._membase_task.cancel()
+            try:
+                await self._membase_task
+            except asyncio.CancelledError:
+                pass
+        self._membase_task = None
+    
+    def _format_membase_message(self, event_data: Dict[str, Any]) -> str:
+        """Render an event as a Membase message line."""
+        event_type = event_data.get("event_type", "unknown")
+        timestamp = event_data.get("timestamp") or datetime.now().isoformat()
+        
+        # The events JudgeAgent itself emits have a fixed field set
+        keys = event_data.keys()
+        if event_type == "attack" and keys == _ATTACK_EVENT_KEYS:
+            return _ATTACK_MESSAGE_TMPL.format(
+                ts=timestamp,
+                jid=self.agent_id,
+                rt=event_data["red_team_id"],
+                tg=event_data["target_id"],
+                et=event_data["exploit_type"],
+                pl=_truncate_payload(event_data["payload"]),
+            )
+        if event_type == "payout" and keys == _PAYOUT_EVENT_KEYS:
+            return _PAYOUT_MESSAGE_TMPL.format(
+                ts=timestamp,
+                jid=self.agent_id,
+                rt=event_data["red_team_id"],
+                amt=event_data["bounty_amount"],
+                tx=event_data["tx_hash"],
+            )
+        
+        # Format message for Membase
+        message_parts = [
+            f"EVENT: {event_type.upper()}",
+            f"TIMESTAMP: {timestamp}",
+            f"JUDGE_ID: {self.agent_id}"
+        ]
+        
+        if "red_team_id" in event_data:
+            message_parts.append(f"RED_TEAM: {event_data['red_team_id']}")
+        
+        if "target_id" in event_data:
+            message_parts.append(f"TARGET: {event_data['target_id']}")
+        
+        if "bounty_amount" in event_data:
+            message_parts.append(f"BOUNTY: {event_data['bounty_amount']} tokens")
+        
+        if "tx_hash" in event_data:
+            message_parts.append(f"TX_HASH: {event_data['tx_hash']}")
+        
+        if "exploit_type" in event_data:
+            message_parts.append(f"EXPLOIT_TYPE: {event_data['exploit_type']}")
+        
+        if "payload" in event_data:
+            message_parts.append(f"PAYLOAD: {_truncate_payload(event_data['payload'])}")
+        
+        return " | ".join(message_parts)
+    
+    async def _write_membase_event(self, event_data: Dict[str, Any]) -> bool:
+        """Format an event and save it to Membase (see log_to_membase)."""
         try:
             event_type = event_data.get("event_type", "unknown")
-            timestamp = event_data.get("timestamp", datetime.now().isoformat())
-            
-            # Format message for Membase
-            message_parts = [
-                f"EVENT: {event_type.upper()}",
-                f"TIMESTAMP: {timestamp}",
-                f"JUDGE_ID: {self.agent_id}"
-            ]
-            
-            if "red_team_id" in event_data:
-                message_parts.append(f"RED_TEAM: {event_data['red_team_id']}")
-            
-            if "target_id" in event_data:
-                message_parts.append(f"TARGET: {event_data['target_id']}")
-            
-            if "bounty_amount" in event_data:
-                message_parts.append(f"BOUNTY: {event_data['bounty_amount']} tokens")
-            
-            if "tx_hash" in event_data:
-                message_parts.append(f"TX_HASH: {event_data['tx_hash']}")
-            
-            if "exploit_type" in event_data:
-                message_parts.append(f"EXPLOIT_TYPE: {event_data['exploit_type']}")
-            
-            if "payload" in event_data:
-                payload = event_data["payload"]
-                if len(payload) > 100:
-                    payload = payload[:100] + "..."
-                message_parts.append(f"PAYLOAD: {payload}")
-            
-            message = " | ".join(message_parts)
+            message = self._format_membase_message(event_data)
             
             # Determine conversation ID based on event type
             conversation_id = f"0xguard_{event_type}s"
@@ -610,13 +833,12 @@ class JudgeAgent:
         """
         total_attacks = sum(len(attacks) for attacks in self.attack_history.values())
         total_bounties = len(self.bounty_history)
-        total_bounty_amount = sum(b["bounty_amount"] for b in self.bounty_history)
         
         return {
             "agent_id": self.agent_id,
             "total_attacks_monitored": total_attacks,
             "total_bounties_paid": total_bounties,
-            "total_bounty_amount": total_bounty_amount,
+            "total_bounty_amount": self._history_bounty_amount,
             "daily_bounty_total": self.daily_bounty_total,
             "daily_cap_remaining": self.daily_cap - self.daily_bounty_total,
             "unique_red_teams": len(self.attack_history),
@@ -10,18 +10,21 @@ This module integrates all components:
 import os
 import sys
 import asyncio
+import logging
 import json
+import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Set, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
 import traceback
+from collections import OrderedDict, defaultdict
 
 # Add paths for imports
 sys.path.insert(0, str(Path(__file__).parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "membase"))
 
-from logger import log
+from logger import log, log_lazy, stdlib_logger
 from judge_agent import JudgeAgent, AttackData, AttackResult, VerificationResult, BountyResult
 from unibase import save_bounty_token
 from config import Config, get_config
@@ -37,6 +40,76 @@ except ImportError:
     VerificationEvent = None
     PayoutEvent = None
 
+# uvloop comes with uvicorn[standard]; it is unavailable on Windows, where the
+# default event loop is used
+try:
+    import uvloop  # pyright: ignore[reportMissingImports]
+except ImportError:
+    uvloop = None
+
+# Prefer orjson for pretty-printing statistics, falling back to the stdlib
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+    
+    def _dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    def _dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
+# Audit log batching: events are queued and written to the AuditLogger by a
+# background task, at most AUDIT_BATCH_SIZE per write or every
+# AUDIT_FLUSH_INTERVAL seconds, whichever comes first
+AUDIT_QUEUE_SIZE = 20000
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL = 0.05  # seconds
+
+# Events processed at once by process_batch() and submit_attack()
+MAX_CONCURRENT_EVENTS = 32
+
+# Last ISO timestamp string parsed by _coerce_ts; events in a burst tend to
+# carry the same timestamp, so repeats skip the parse
+_last_parsed_ts: tuple = ("", None)
+
+
+def _coerce_ts(value: Any, default: datetime) -> datetime:
+    """
+    Normalize an event timestamp to a datetime.
+    
+    Args:
+        value: datetime, ISO format string, or None
+        default: Returned when value is None
+    
+    Returns:
+        datetime: The timestamp
+    """
+    global _last_parsed_ts
+    if value is None:
+        return default
+    if isinstance(value, datetime):
+        return value
+    if value != _last_parsed_ts[0]:
+        _last_parsed_ts = (value, datetime.fromisoformat(value))
+    return _last_parsed_ts[1]
+
+
+@dataclass(slots=True)
+class ActiveAttack:
+    """Tracked attack, from monitor_attack until its result is processed."""
+    red_team_id: str
+    target_id: str
+    exploit_type: str
+    payload: str
+    timestamp: datetime
+    status: str = "monitoring"  # monitoring, rejected, bounty_failed, completed
+    rejection_reason: Optional[str] = None
+    bounty_paid: int = 0
+    tx_hash: Optional[str] = None
+
 
 class IntegratedJudgeAgent:
     """
@@ -49,20 +122,23 @@ class IntegratedJudgeAgent:
     - Comprehensive error handling and monitoring
     """
     
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(self, config: Optional[Config] = None, validate: bool = True):
         """
         Initialize Integrated Judge Agent.
         
         Args:
             config: Configuration object (loads from env if None)
+            validate: Validate the configuration; pass False if the caller
+                already has
         """
         self.config = config or get_config()
         
         # Validate configuration
-        try:
-            self.config.validate()
-        except ValueError as e:
-            log("JudgeAgent", f"Configuration validation warning: {str(e)}", "⚖️", "warning")
+        if validate:
+            try:
+                self.config.validate()
+            except ValueError as e:
+                log("JudgeAgent", f"Configuration validation warning: {str(e)}", "⚖️", "warning")
         
         log("JudgeAgent", "Initializing Integrated Judge Agent...", "⚖️", "info")
         
@@ -114,8 +190,28 @@ class IntegratedJudgeAgent:
         else:
             log("JudgeAgent", "AuditLogger not available or disabled", "💾", "warning")
         
-        # Active attacks tracking
-        self.active_attacks: Dict[str, Dict[str, Any]] = {}
+        # Background AuditLogger writer, started on the first queued event.
+        # The caller never awaits the AuditLogger itself; see _queue_audit_event
+        self._audit_queue: asyncio.Queue = asyncio.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        self._audit_flusher: Optional[asyncio.Task] = None
+        
+        # Active attacks tracking, in least recently used order. Entries past
+        # MAX_ACTIVE_ATTACKS are evicted; earnings and per-target totals are
+        # kept as running aggregates so statistics don't need the history
+        self.active_attacks: "OrderedDict[str, ActiveAttack]" = OrderedDict()
+        self.max_active_attacks = self.config.MAX_ACTIVE_ATTACKS
+        
+        # Concurrent event processing (process_batch / submit_attack)
+        self._event_semaphore = asyncio.Semaphore(MAX_CONCURRENT_EVENTS)
+        self._submitted: Set[asyncio.Task] = set()
+        
+        # Running aggregates for the statistics fallbacks
+        self._earnings: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"total": 0, "count": 0, "last": None}
+        )
+        self._target_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"attacks": 0, "bounties_paid": 0}
+        )
         
         # Statistics
         self.stats = {
@@ -124,6 +220,7 @@ class IntegratedJudgeAgent:
             "bounties_paid": 0,
             "total_bounty_amount": 0,
             "errors": 0,
+            "audit_events_dropped": 0,
             "start_time": datetime.now()
         }
         
@@ -144,18 +241,16 @@ class IntegratedJudgeAgent:
             attack_data: Attack data dictionary with:
                 - exploit_type: str
                 - payload: str
-                - timestamp: datetime (optional)
+                - timestamp: datetime or ISO string (optional)
         
         Returns:
             dict: Monitoring result with event_id and status
         """
         try:
-            log("JudgeAgent", f"Monitoring attack: {red_team_id} → {target_id}", "⚖️", "info")
+            log_lazy("JudgeAgent", "Monitoring attack: %s → %s", red_team_id, target_id, emoji="⚖️", kind="debug")
             
             # Prepare attack data
-            timestamp = attack_data.get("timestamp", datetime.now())
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp)
+            timestamp = _coerce_ts(attack_data.get("timestamp"), datetime.now())
             
             attack = AttackData(
                 exploit_type=attack_data.get("exploit_type", "unknown"),
@@ -164,7 +259,7 @@ class IntegratedJudgeAgent:
             )
             
             # Monitor via JudgeAgent
-            monitor_result = await self.judge.monitor_attack(
+            await self.judge.monitor_attack(
                 red_team_id=red_team_id,
                 target_id=target_id,
                 attack_data=attack
@@ -174,27 +269,25 @@ class IntegratedJudgeAgent:
             event_id = self._generate_event_id("attack", red_team_id, target_id)
             
             # Store in active attacks
-            self.active_attacks[event_id] = {
+            self.active_attacks[event_id] = ActiveAttack(
+                red_team_id=red_team_id,
+                target_id=target_id,
+                exploit_type=attack.exploit_type,
+                payload=attack.payload,
+                timestamp=timestamp
+            )
+            while len(self.active_attacks) > self.max_active_attacks:
+                self.active_attacks.popitem(last=False)
+            self._target_stats[target_id]["attacks"] += 1
+            
+            # Log to AuditLogger if available
+            await self._queue_audit_event("log_attack_attempt", {
                 "red_team_id": red_team_id,
                 "target_id": target_id,
-                "attack_data": attack_data,
-                "monitor_result": monitor_result,
+                "attack_type": attack.exploit_type,
                 "timestamp": timestamp,
-                "status": "monitoring"
-            }
-            
-            # Log to AuditLogger if available
-            if self.audit_logger:
-                try:
-                    await self.audit_logger.log_attack_attempt({
-                        "red_team_id": red_team_id,
-                        "target_id": target_id,
-                        "attack_type": attack.exploit_type,
-                        "timestamp": timestamp,
-                        "success": False  # Will be updated when result comes in
-                    })
-                except Exception as e:
-                    log("JudgeAgent", f"Failed to log attack to AuditLogger: {str(e)}", "💾", "error")
+                "success": False  # Will be updated when result comes in
+            })
             
             self.stats["attacks_monitored"] += 1
             
@@ -209,7 +302,7 @@ class IntegratedJudgeAgent:
             self.stats["errors"] += 1
             error_msg = f"Error monitoring attack: {str(e)}"
             log("JudgeAgent", error_msg, "⚖️", "error")
-            log("JudgeAgent", traceback.format_exc(), "⚖️", "error")
+            self._log_traceback()
             return {
                 "event_id": None,
                 "status": "error",
@@ -229,13 +322,13 @@ class IntegratedJudgeAgent:
             attack_result: Attack result dictionary with:
                 - success: bool
                 - secret_key: str (optional)
-                - timestamp: datetime (optional)
+                - timestamp: datetime or ISO string (optional)
         
         Returns:
             dict: Processing result with success status and details
         """
         try:
-            log("JudgeAgent", f"Processing attack result for event: {event_id}", "⚖️", "info")
+            log_lazy("JudgeAgent", "Processing attack result for event: %s", event_id, emoji="⚖️", kind="debug")
             
             # Check if event exists
             if event_id not in self.active_attacks:
@@ -247,51 +340,46 @@ class IntegratedJudgeAgent:
                 }
             
             attack_info = self.active_attacks[event_id]
-            red_team_id = attack_info["red_team_id"]
-            target_id = attack_info["target_id"]
-            attack_data = attack_info["attack_data"]
+            self.active_attacks.move_to_end(event_id)
+            red_team_id = attack_info.red_team_id
+            target_id = attack_info.target_id
             
             # Prepare attack result for verification
-            timestamp = attack_result.get("timestamp", datetime.now())
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp)
+            now = datetime.now()
+            timestamp = _coerce_ts(attack_result.get("timestamp"), now)
             
             result = AttackResult(
                 success=attack_result.get("success", False),
                 secret_key=attack_result.get("secret_key"),
                 target_id=target_id,
                 exploit_details={
-                    "exploit_type": attack_data.get("exploit_type", "unknown"),
-                    "payload": attack_data.get("payload", ""),
+                    "exploit_type": attack_info.exploit_type,
+                    "payload": attack_info.payload,
                     "timestamp": timestamp.isoformat()
                 }
             )
             
             # Step 1: Verify exploit
-            log("JudgeAgent", "Verifying exploit...", "⚖️", "info")
+            log_lazy("JudgeAgent", "Verifying exploit...", emoji="⚖️", kind="debug")
             verification = self.judge.verify_exploit(result)
             
             # Log verification to AuditLogger
-            if self.audit_logger:
-                try:
-                    await self.audit_logger.log_exploit_verification({
-                        "exploit_id": event_id,
-                        "is_valid": verification.is_valid,
-                        "severity": verification.severity,
-                        "secret_key_match": (
-                            verification.is_valid and
-                            result.secret_key == self.config.secret_key
-                        ),
-                        "verification_time": datetime.now(),
-                        "target_id": target_id
-                    })
-                except Exception as e:
-                    log("JudgeAgent", f"Failed to log verification: {str(e)}", "💾", "error")
+            await self._queue_audit_event("log_exploit_verification", {
+                "exploit_id": event_id,
+                "is_valid": verification.is_valid,
+                "severity": verification.severity,
+                "secret_key_match": (
+                    verification.is_valid and
+                    result.secret_key == self.config.TARGET_SECRET_KEY
+                ),
+                "verification_time": now,
+                "target_id": target_id
+            })
             
             if not verification.is_valid:
-                log("JudgeAgent", f"Exploit verification failed: {verification.reason}", "⚖️", "warning")
-                attack_info["status"] = "rejected"
-                attack_info["rejection_reason"] = verification.reason
+                log_lazy("JudgeAgent", "Exploit verification failed: %s", verification.reason, emoji="⚖️", kind="warning")
+                attack_info.status = "rejected"
+                attack_info.rejection_reason = verification.reason
                 return {
                     "success": False,
                     "reason": verification.reason,
@@ -299,10 +387,10 @@ class IntegratedJudgeAgent:
                 }
             
             self.stats["exploits_verified"] += 1
-            log("JudgeAgent", f"Exploit verified: {verification.severity} severity", "⚖️", "info")
+            log_lazy("JudgeAgent", "Exploit verified: %s severity", verification.severity, emoji="⚖️", kind="info")
             
             # Step 2: Trigger bounty payout
-            log("JudgeAgent", f"Triggering bounty: {verification.bounty_amount} tokens", "⚖️", "info")
+            log_lazy("JudgeAgent", "Triggering bounty: %s tokens", verification.bounty_amount, emoji="⚖️", kind="info")
             
             bounty_result = await self.judge.trigger_bounty(
                 red_team_id=red_team_id,
@@ -313,39 +401,42 @@ class IntegratedJudgeAgent:
             if not bounty_result.success:
                 error_msg = f"Failed to trigger bounty payout"
                 log("JudgeAgent", error_msg, "⚖️", "error")
-                attack_info["status"] = "bounty_failed"
+                attack_info.status = "bounty_failed"
                 return {
                     "success": False,
                     "error": error_msg,
                     "severity": verification.severity
                 }
             
-            # Step 3: Log payout to AuditLogger
-            if self.audit_logger:
-                try:
-                    await self.audit_logger.log_bounty_payout({
-                        "bounty_id": f"bounty_{event_id}",
-                        "red_team_id": red_team_id,
-                        "amount": verification.bounty_amount,
-                        "tx_hash": bounty_result.tx_hash,
-                        "status": "confirmed" if bounty_result.success else "failed",
-                        "timestamp": datetime.now(),
-                        "exploit_id": event_id
-                    })
-                except Exception as e:
-                    log("JudgeAgent", f"Failed to log payout: {str(e)}", "💾", "error")
+            # Step 3: Log payout to AuditLogger (trigger_bounty may have waited
+            # on retries or a queued slot, so the payout gets its own time)
+            paid_at = datetime.now()
+            await self._queue_audit_event("log_bounty_payout", {
+                "bounty_id": f"bounty_{event_id}",
+                "red_team_id": red_team_id,
+                "amount": verification.bounty_amount,
+                "tx_hash": bounty_result.tx_hash,
+                "status": "confirmed" if bounty_result.success else "failed",
+                "timestamp": paid_at,
+                "exploit_id": event_id
+            })
             
             # Update statistics
             self.stats["bounties_paid"] += 1
             self.stats["total_bounty_amount"] += verification.bounty_amount
+            earnings = self._earnings[red_team_id]
+            earnings["total"] += verification.bounty_amount
+            earnings["count"] += 1
+            earnings["last"] = paid_at
+            self._target_stats[target_id]["bounties_paid"] += verification.bounty_amount
             
             # Cleanup
-            attack_info["status"] = "completed"
-            attack_info["bounty_paid"] = verification.bounty_amount
-            attack_info["tx_hash"] = bounty_result.tx_hash
+            attack_info.status = "completed"
+            attack_info.bounty_paid = verification.bounty_amount
+            attack_info.tx_hash = bounty_result.tx_hash
             
-            log("JudgeAgent", f"✅ Bounty paid: {verification.bounty_amount} tokens", "⚖️", "info")
-            log("JudgeAgent", f"📝 TX Hash: {bounty_result.tx_hash}", "⚖️", "info")
+            log_lazy("JudgeAgent", "✅ Bounty paid: %s tokens", verification.bounty_amount, emoji="⚖️", kind="info")
+            log_lazy("JudgeAgent", "📝 TX Hash: %s", bounty_result.tx_hash, emoji="⚖️", kind="info")
             
             return {
                 "success": True,
@@ -359,16 +450,172 @@ class IntegratedJudgeAgent:
             self.stats["errors"] += 1
             error_msg = f"Error processing attack result: {str(e)}"
             log("JudgeAgent", error_msg, "⚖️", "error")
-            log("JudgeAgent", traceback.format_exc(), "⚖️", "error")
+            self._log_traceback()
             return {
                 "success": False,
                 "error": error_msg
             }
     
+    async def process_batch(self, events: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Process several attack results concurrently.
+        
+        At most MAX_CONCURRENT_EVENTS results are processed at a time.
+        
+        Args:
+            events: (event_id, attack_result) pairs, as for process_attack_result
+        
+        Returns:
+            list: Processing results, in the same order as events
+        """
+        async def process(event_id: str, attack_result: Dict[str, Any]) -> Dict[str, Any]:
+            async with self._event_semaphore:
+                return await self.process_attack_result(event_id, attack_result)
+        
+        results = await asyncio.gather(
+            *(process(event_id, attack_result) for event_id, attack_result in events),
+            return_exceptions=True
+        )
+        return [
+            {"success": False, "error": f"Error processing attack result: {str(r)}"}
+            if isinstance(r, BaseException) else r
+            for r in results
+        ]
+    
+    def submit_attack(
+        self,
+        red_team_id: str,
+        target_id: str,
+        attack_data: Dict[str, Any]
+    ) -> asyncio.Task:
+        """
+        Start monitoring an attack in the background.
+        
+        Like monitor_attack, but returns immediately; await the returned task
+        for the monitoring result. Shares the process_batch concurrency limit.
+        
+        Returns:
+            asyncio.Task: Task resolving to the monitor_attack result
+        """
+        async def monitor() -> Dict[str, Any]:
+            async with self._event_semaphore:
+                return await self.monitor_attack(red_team_id, target_id, attack_data)
+        
+        task = asyncio.create_task(monitor())
+        self._submitted.add(task)
+        task.add_done_callback(self._submitted.discard)
+        return task
+    
+    def _log_traceback(self) -> None:
+        """
+        Log the traceback of the exception being handled.
+        
+        Only when the "0xguard" logger is at DEBUG: formatting walks every
+        frame, which adds up when events fail in bulk.
+        """
+        if stdlib_logger.isEnabledFor(logging.DEBUG):
+            log("JudgeAgent", traceback.format_exc(), "⚖️", "error")
+    
+    async def _queue_audit_event(self, method: str, event: Dict[str, Any]) -> None:
+        """
+        Queue an event for the background AuditLogger writer.
+        
+        When the queue is full the oldest queued event is dropped (and counted
+        in stats["audit_events_dropped"]) so logging never blocks the caller,
+        unless AUDIT_BLOCK_WHEN_FULL is set, in which case the caller waits
+        for room instead.
+        
+        Args:
+            method: AuditLogger method that records the event
+                (log_attack_attempt, log_exploit_verification, log_bounty_payout)
+            event: Event dictionary passed to that method
+        """
+        if not self.audit_logger:
+            return
+        
+        if self._audit_flusher is None or self._audit_flusher.done():
+            if self._audit_flusher is not None and not self._audit_flusher.cancelled() and self._audit_flusher.exception():
+                log("JudgeAgent", f"Audit writer stopped: {self._audit_flusher.exception()}; restarting", "💾", "error")
+            # Restart on the existing queue so events queued before the writer stopped are kept
+            self._audit_flusher = asyncio.create_task(self._audit_flush_loop())
+        
+        queue = self._audit_queue
+        if self.config.AUDIT_BLOCK_WHEN_FULL:
+            await queue.put((method, event))
+            return
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            self.stats["audit_events_dropped"] += 1
+        queue.put_nowait((method, event))
+    
+    async def _audit_flush_loop(self) -> None:
+        """Write queued audit events in batches until cancelled."""
+        queue = self._audit_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + AUDIT_FLUSH_INTERVAL
+            while len(batch) < AUDIT_BATCH_SIZE:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write_audit_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _write_audit_batch(self, batch: List[tuple]) -> None:
+        """
+        Write a batch of (method, event) pairs to the AuditLogger.
+        
+        Uses AuditLogger.log_batch() when the logger provides it, otherwise
+        falls back to one call per event. Failures are logged, not raised.
+        """
+        log_batch = getattr(self.audit_logger, "log_batch", None)
+        if log_batch is not None:
+            try:
+                await log_batch(batch)
+            except Exception as e:
+                log("JudgeAgent", f"Failed to write audit batch ({len(batch)} events): {str(e)}", "💾", "error")
+            return
+        
+        for method, event in batch:
+            try:
+                await getattr(self.audit_logger, method)(event)
+            except Exception as e:
+                log("JudgeAgent", f"Failed to write audit event via {method}: {str(e)}", "💾", "error")
+    
+    async def _drain_audit_queue(self) -> None:
+        """Write out queued audit events and stop the background writer."""
+        if self._audit_flusher is None:
+            return
+        if self._audit_flusher.done() and not self._audit_queue.empty():
+            self._audit_flusher = asyncio.create_task(self._audit_flush_loop())
+        if not self._audit_flusher.done():
+            await self._audit_queue.join()
+            self._audit_flusher.cancel()
+            try:
+                await self._audit_flusher
+            except asyncio.CancelledError:
+                pass
+        self._audit_flusher = None
+    
     def _generate_event_id(self, event_type: str, red_team_id: str, target_id: str) -> str:
         """
         Generate unique event ID.
         
+        Uniqueness comes from a random UUID; the arguments are accepted for
+        call-site readability but are not encoded in the ID.
+        
         Args:
             event_type: Type of event
             red_team_id: Red Team identifier
@@ -377,11 +624,7 @@ class IntegratedJudgeAgent:
         Returns:
             str: Unique event ID
         """
-        import hashlib
-        import uuid
-        
-        unique_str = f"{event_type}_{red_team_id}_{target_id}_{datetime.now().isoformat()}_{uuid.uuid4().hex[:8]}"
-        return f"evt_{hashlib.sha256(unique_str.encode()).hexdigest()[:16]}"
+        return f"evt_{uuid.uuid4().hex[:16]}"
     
     async def get_statistics(self) -> Dict[str, Any]:
         """
@@ -424,24 +667,16 @@ class IntegratedJudgeAgent:
             except Exception as e:
                 log("JudgeAgent", f"Error getting earnings: {str(e)}", "⚖️", "error")
         
-        # Fallback: calculate from active attacks
-        total = sum(
-            attack.get("bounty_paid", 0)
-            for attack in self.active_attacks.values()
-            if attack.get("red_team_id") == red_team_id and attack.get("status") == "completed"
-        )
+        # Fallback: running earnings totals
+        earnings = self._earnings.get(red_team_id)
+        if earnings is None:
+            return {"total_earned": 0, "bounty_count": 0, "avg_bounty": 0.0, "last_payout": None}
         
         return {
-            "total_earned": total,
-            "bounty_count": sum(
-                1 for attack in self.active_attacks.values()
-                if attack.get("red_team_id") == red_team_id and attack.get("status") == "completed"
-            ),
-            "avg_bounty": total / max(1, sum(
-                1 for attack in self.active_attacks.values()
-                if attack.get("red_team_id") == red_team_id and attack.get("status") == "completed"
-            )),
-            "last_payout": None
+            "total_earned": earnings["total"],
+            "bounty_count": earnings["count"],
+            "avg_bounty": earnings["total"] / max(1, earnings["count"]),
+            "last_payout": earnings["last"]
         }
     
     async def get_attack_statistics(self, target_id: Optional[str] = None) -> Dict[str, Any]:
@@ -460,25 +695,29 @@ class IntegratedJudgeAgent:
             except Exception as e:
                 log("JudgeAgent", f"Error getting attack stats: {str(e)}", "⚖️", "error")
         
-        # Fallback: calculate from active attacks
-        attacks = [
-            attack for attack in self.active_attacks.values()
-            if target_id is None or attack.get("target_id") == target_id
-        ]
+        # Fallback: running per-target totals
+        if target_id is None:
+            total_attacks = self.stats["attacks_monitored"]
+            total_bounties = self.stats["total_bounty_amount"]
+        else:
+            target_stats = self._target_stats.get(target_id, {"attacks": 0, "bounties_paid": 0})
+            total_attacks = target_stats["attacks"]
+            total_bounties = target_stats["bounties_paid"]
         
         return {
-            "total_attacks": len(attacks),
+            "total_attacks": total_attacks,
             "success_rate": 0.0,
             "vulnerability_types": {},
-            "total_bounties_paid": sum(
-                attack.get("bounty_paid", 0) for attack in attacks
-                if attack.get("status") == "completed"
-            ),
+            "total_bounties_paid": total_bounties,
             "top_red_teams": []
         }
     
     async def flush_logs(self) -> None:
         """Flush all pending logs."""
+        if self._submitted:
+            await asyncio.gather(*self._submitted, return_exceptions=True)
+        await self.judge.cleanup()
+        await self._drain_audit_queue()
         if self.audit_logger:
             try:
                 await self.audit_logger.flush()
@@ -494,7 +733,7 @@ class IntegratedJudgeAgent:
         
         # Print final statistics
         stats = await self.get_statistics()
-        log("JudgeAgent", f"Final statistics: {json.dumps(stats, indent=2, default=str)}", "⚖️", "info")
+        log("JudgeAgent", f"Final statistics: {_dumps_pretty(stats)}", "⚖️", "info")
         
         log("JudgeAgent", "Shutdown complete", "⚖️", "info")
 
@@ -514,7 +753,7 @@ async def main():
             log("JudgeAgent", "Continuing with default values...", "⚖️", "info")
         
         # Initialize Judge Agent
-        judge = IntegratedJudgeAgent(config)
+        judge = IntegratedJudgeAgent(config, validate=False)
         
         log("JudgeAgent", "🔍 Judge Agent initialized", "⚖️", "info")
         log("JudgeAgent", "⏳ Monitoring for attacks...", "⚖️", "info")
@@ -542,7 +781,7 @@ async def main():
         
         attack_result = {
             "success": True,
-            "secret_key": config.secret_key,  # Use configured secret key
+            "secret_key": config.TARGET_SECRET_KEY,  # Use configured secret key
             "timestamp": datetime.now()
         }
         
@@ -561,14 +800,14 @@ async def main():
         print("Statistics")
         print("="*60 + "\n")
         stats = await judge.get_statistics()
-        print(json.dumps(stats, indent=2, default=str))
+        print(_dumps_pretty(stats))
         
         # Get Red Team earnings
         print("\n" + "="*60)
         print("Red Team Earnings")
         print("="*60 + "\n")
         earnings = await judge.get_red_team_earnings("red_team_alpha")
-        print(json.dumps(earnings, indent=2, default=str))
+        print(_dumps_pretty(earnings))
         
         # Shutdown
         await judge.shutdown()
@@ -582,5 +821,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        asyncio.run(main())
 
@@ -9,9 +9,12 @@ All logs include:
 - auditId (if available)
 """
 import json
+import logging
+import os
 import threading
 import sys
 import platform
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Literal
@@ -23,6 +26,32 @@ try:
 except ImportError:
     HAS_FCNTL = False
 
+# Prefer orjson for encoding and parsing log lines, falling back to the stdlib
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+    
+    def _encode_entry(log_entry: dict) -> bytes:
+        """Encode a log entry as one JSON line."""
+        return orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE)
+    
+    def _encode_needle(value: str) -> bytes:
+        """Encode a string as the JSON literal it appears as in a log line."""
+        return orjson.dumps(value)
+    
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    def _encode_entry(log_entry: dict) -> bytes:
+        """Encode a log entry as one JSON line."""
+        return (json.dumps(log_entry, ensure_ascii=False) + "\n").encode("utf-8")
+    
+    def _encode_needle(value: str) -> bytes:
+        """Encode a string as the JSON literal it appears as in a log line."""
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+    
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 # Import Redis client
 try:
     from redis_client import (
@@ -34,25 +63,170 @@ try:
 except ImportError:
     REDIS_CLIENT_AVAILABLE = False
 
+# Last Redis liveness check as (monotonic timestamp, result); bursts of log
+# calls share one ping instead of pinging per entry
+REDIS_CHECK_TTL = 1.0  # seconds
+_redis_check: tuple[float, bool] = (float("-inf"), False)
+
 # Type definitions
 Category = Literal["attack", "proof", "status", "error"]
 
 # Thread lock for safe file writing (fallback)
 _log_lock = threading.Lock()
-_log_file = Path(__file__).parent.parent / "logs.json"
+_log_file = Path(__file__).parent.parent / "logs.jsonl"  # one JSON entry per line
 
+# The log file keeps roughly the last MAX_LOG_ENTRIES entries. Appends are
+# O(1); once the file grows past _LOG_TRIM_BYTES it is cut back to the last
+# MAX_LOG_ENTRIES lines or _LOG_KEEP_BYTES, whichever is smaller, so the cost
+# of trimming is spread over many appends even when entries are large
+MAX_LOG_ENTRIES = 10000
+_LOG_TRIM_BYTES = 8 * 1024 * 1024
+_LOG_KEEP_BYTES = _LOG_TRIM_BYTES // 2
+_TAIL_CHUNK_SIZE = 64 * 1024
+_LOCK_ATTEMPTS = 5  # reopens of a replaced log file before appending unlocked
 
-def _ensure_log_file():
-    """Initialize logs.json as empty array if it doesn't exist."""
-    if not _log_file.exists():
-        with _log_lock:
+_USE_FLOCK = HAS_FCNTL and platform.system() != 'Windows'
+
+# Level gate for log_lazy(); defaults to INFO so every entry is recorded
+# unless an operator raises the level of the "0xguard" logger
+stdlib_logger = logging.getLogger("0xguard")
+stdlib_logger.setLevel(logging.INFO)
+
+_KIND_LEVELS = {
+    "debug": logging.DEBUG,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+def _open_locked_for_append():
+    """
+    Open logs.jsonl for appending, holding an exclusive lock (Unix).
+    
+    A trim or clear replaces the file; if that happened while waiting for the
+    lock, the stale handle is dropped and the new file is opened instead. If
+    the filesystem cannot lock (e.g. ENOLCK on some network or container
+    volumes) the handle is returned unlocked.
+    """
+    for _ in range(_LOCK_ATTEMPTS):
+        f = open(_log_file, "ab")
+        if not _USE_FLOCK:
+            return f
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        except OSError:
+            return f  # Locking unavailable, proceed unlocked
+        try:
+            if os.fstat(f.fileno()).st_ino == os.stat(_log_file).st_ino:
+                return f
+        except FileNotFoundError:
+            pass
+        f.close()
+    # The file keeps being replaced under us; append to it unlocked
+    return open(_log_file, "ab")
+
+
+def _replace_log_file(lines: list) -> None:
+    """
+    Atomically replace logs.jsonl with the given encoded lines.
+    
+    Falls back to rewriting the file in place when it cannot be renamed
+    over (e.g. a single-file Docker bind mount). Callers hold the lock
+    from _open_locked_for_append().
+    """
+    tmp_path = _log_file.with_name(f"{_log_file.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.writelines(lines)
+    try:
+        os.replace(tmp_path, _log_file)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        with open(_log_file, "wb") as f:
+            f.writelines(lines)
+
+
+def _tail_lines(path: Path, n: int, lock: bool = True, max_bytes: Optional[int] = None) -> list:
+    """
+    Read the last n non-empty lines of a file.
+    
+    Reads backward from the end in _TAIL_CHUNK_SIZE chunks, so the cost
+    depends on n rather than on the file size.
+    
+    Args:
+        path: File to read
+        n: Number of lines
+        lock: Take a shared lock while reading; pass False when the caller
+            already holds the exclusive lock
+        max_bytes: Read at most this many bytes from the end, returning
+            fewer than n lines if they do not fit
+    
+    Returns:
+        list: Lines as bytes (with trailing newline), oldest first
+    """
+    chunks = []
+    newlines = 0
+    with open(path, "rb") as f:
+        if lock and _USE_FLOCK:
             try:
-                # Create parent directory if needed
-                _log_file.parent.mkdir(parents=True, exist_ok=True)
-                # Create empty array file
-                _log_file.write_text("[]")
-            except Exception as e:
-                print(f"Error creating log file: {e}", file=sys.stderr)
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)  # Shared lock for reading
+            except (IOError, OSError):
+                pass  # File locking not available, continue without lock
+        pos = f.seek(0, os.SEEK_END)
+        start = 0 if max_bytes is None else max(0, pos - max_bytes)
+        while pos > start and newlines <= n:
+            step = min(_TAIL_CHUNK_SIZE, pos - start)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+    lines = b"".join(reversed(chunks)).splitlines(keepends=True)
+    if pos > 0:
+        lines = lines[1:]  # First line may start before the chunks read
+    return [line for line in lines if line.strip()][-n:]
+
+
+def _read_file_logs(n: int = MAX_LOG_ENTRIES, needles: tuple = ()) -> list:
+    """
+    Parse the last n entries of logs.jsonl.
+    
+    Args:
+        n: Number of lines to read from the end of the file
+        needles: Encoded strings a line must contain to be parsed; a cheap
+            pre-filter, the parsed entries are still filtered exactly
+    
+    Returns:
+        list: Log entries, oldest first (corrupt lines are skipped)
+    """
+    if not _log_file.exists():
+        return []
+    logs = []
+    for line in _tail_lines(_log_file, n):
+        if not all(needle in line for needle in needles):
+            continue
+        try:
+            logs.append(_json_loads(line))
+        except _JSONDecodeError:
+            continue
+    return logs
+
+
+def _redis_ok() -> bool:
+    """Whether Redis is usable, re-checked at most every REDIS_CHECK_TTL seconds."""
+    global _redis_check
+    if not REDIS_CLIENT_AVAILABLE:
+        return False
+    now = time.monotonic()
+    if now - _redis_check[0] >= REDIS_CHECK_TTL:
+        _redis_check = (now, is_redis_available())
+    return _redis_check[1]
+
+
+def _redis_failed() -> None:
+    """Forget the cached liveness result so the next call checks Redis again."""
+    global _redis_check
+    _redis_check = (float("-inf"), False)
 
 
 def _map_log_type_to_category(log_type: str, is_vulnerability: bool = False) -> Category:
@@ -87,7 +261,7 @@ def log(
     audit_id: Optional[str] = None,
 ) -> None:
     """
-    Write a structured log entry to Redis (preferred) or logs.json (fallback).
+    Write a structured log entry to Redis (preferred) or logs.jsonl (fallback).
     
     All logs include:
     - timestamp: ISO format timestamp
@@ -122,7 +296,7 @@ def log(
         log_entry["auditId"] = audit_id
     
     # Try Redis first (preferred method)
-    if REDIS_CLIENT_AVAILABLE and is_redis_available():
+    if _redis_ok():
         try:
             if redis_append_log(log_entry, audit_id=audit_id):
                 # Also write to file as backup (optional, for backward compatibility)
@@ -131,88 +305,66 @@ def log(
         except Exception:
             # Fall through to file-based logging if Redis fails
             pass
+        _redis_failed()
     
     # Fallback to file-based logging
     _write_to_file_fallback(log_entry)
 
 
+def log_lazy(
+    component: str,
+    fmt: str,
+    *args,
+    emoji: str = "🔵",
+    kind: str = "info",
+    is_vulnerability: bool = False,
+    audit_id: Optional[str] = None,
+) -> None:
+    """
+    Like log(), but with %-style arguments that are only formatted if the
+    entry's level is enabled on stdlib_logger.
+    
+    Meant for per-message hot paths; the check is a cached level lookup, so
+    filtered entries cost neither the string formatting nor the write.
+    
+    Args:
+        component: The actor name (e.g., "Judge")
+        fmt: %-style format string for the message
+        *args: Arguments for fmt
+        emoji: Emoji icon for the actor
+        kind: Type of log, as log_type in log()
+        is_vulnerability: If True, highlights the log as a vulnerability
+        audit_id: Optional audit ID to group logs by audit
+    """
+    level = _KIND_LEVELS.get(kind.lower(), logging.INFO)
+    if not stdlib_logger.isEnabledFor(level):
+        return
+    log(component, fmt % args if args else fmt, emoji, kind, is_vulnerability=is_vulnerability, audit_id=audit_id)
+
+
 def _write_to_file_fallback(log_entry: dict) -> None:
     """
-    Write log entry to file using append-only mode with file locking.
+    Append a log entry to logs.jsonl as a single JSON line.
     
-    Uses append-only mode to prevent corruption:
-    1. Read existing logs
-    2. Append new log
-    3. Write back (with file locking)
+    The append holds an exclusive file lock (Unix) so lines from several
+    agent processes never interleave, and trims the file once it grows past
+    _LOG_TRIM_BYTES.
     
     Args:
         log_entry: Log entry dictionary
     """
-    _ensure_log_file()
+    line = _encode_entry(log_entry)
     
     with _log_lock:
         try:
-            # Read existing logs with file locking (Unix) or thread-safe write (Windows)
-            if _log_file.exists():
-                if HAS_FCNTL and platform.system() != 'Windows':
-                    # Use fcntl file locking on Unix systems
-                    try:
-                        with open(_log_file, 'r+') as f:
-                            # Try to acquire exclusive lock (non-blocking)
-                            try:
-                                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                            except (IOError, OSError):
-                                # Lock failed, try again with blocking lock
-                                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                            
-                            try:
-                                content = f.read()
-                                logs = json.loads(content) if content.strip() else []
-                            except json.JSONDecodeError:
-                                # File corrupted, start fresh
-                                logs = []
-                            
-                            # Append new log
-                            logs.append(log_entry)
-                            
-                            # Keep last 10000 entries to prevent file from growing too large
-                            if len(logs) > 10000:
-                                logs = logs[-10000:]
-                            
-                            # Write back
-                            f.seek(0)
-                            f.truncate()
-                            f.write(json.dumps(logs, indent=2))
-                            f.flush()
-                            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                    except (IOError, OSError):
-                        # File locking failed, fall back to simple read/write
-                        content = _log_file.read_text()
-                        logs = json.loads(content) if content.strip() else []
-                        logs.append(log_entry)
-                        if len(logs) > 10000:
-                            logs = logs[-10000:]
-                        _log_file.write_text(json.dumps(logs, indent=2))
-                else:
-                    # Windows or no fcntl: use thread-safe read/write (lock already held)
-                    content = _log_file.read_text()
-                    logs = json.loads(content) if content.strip() else []
-                    logs.append(log_entry)
-                    if len(logs) > 10000:
-                        logs = logs[-10000:]
-                    _log_file.write_text(json.dumps(logs, indent=2))
-            else:
-                # File doesn't exist, create it with first log
-                logs = [log_entry]
-                _log_file.write_text(json.dumps(logs, indent=2))
-                
-        except (json.JSONDecodeError, IOError, OSError) as e:
-            # If file is corrupted or can't be written, create new one
-            try:
-                _log_file.write_text(json.dumps([log_entry], indent=2))
-            except Exception:
-                # Last resort: print to stderr
-                print(f"Failed to write log: {json.dumps(log_entry)}", file=sys.stderr)
+            with _open_locked_for_append() as f:
+                f.write(line)
+                f.flush()
+                if f.tell() > _LOG_TRIM_BYTES:
+                    _replace_log_file(_tail_lines(_log_file, MAX_LOG_ENTRIES, lock=False, max_bytes=_LOG_KEEP_BYTES))
+        except (IOError, OSError):
+            # Last resort: print to stderr
+            print(f"Failed to write log: {line.decode('utf-8').rstrip()}", file=sys.stderr)
 
 
 def get_logs(
@@ -234,44 +386,27 @@ def get_logs(
         list: Filtered log entries
     """
     # Try Redis first
-    if REDIS_CLIENT_AVAILABLE and is_redis_available():
+    if _redis_ok():
         try:
             logs = redis_get_logs(audit_id=audit_id)
             # Apply additional filters
             return _filter_logs(logs, category=category, since=since, limit=limit)
         except Exception:
             # Fall through to file-based retrieval
-            pass
+            _redis_failed()
     
-    # Fallback to file-based retrieval
-    _ensure_log_file()
+    # Fallback to file-based retrieval. Entries are appended in time order, so
+    # without audit/category filters only the last `limit` lines are needed
+    n = MAX_LOG_ENTRIES
+    if limit is not None and limit > 0 and not audit_id and not category:
+        n = min(limit, MAX_LOG_ENTRIES)
+    needles = tuple(
+        _encode_needle(value) for value in (audit_id, category) if value
+    )
     
     try:
-        if _log_file.exists():
-            if HAS_FCNTL and platform.system() != 'Windows':
-                # Use fcntl file locking on Unix systems
-                with open(_log_file, 'r') as f:
-                    try:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_SH)  # Shared lock for reading
-                    except (IOError, OSError):
-                        # File locking not available, continue without lock
-                        pass
-                    
-                    try:
-                        content = f.read()
-                        logs = json.loads(content) if content.strip() else []
-                    finally:
-                        try:
-                            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                        except (IOError, OSError):
-                            pass
-            else:
-                # Windows or no fcntl: simple read (lock not critical for reads)
-                content = _log_file.read_text()
-                logs = json.loads(content) if content.strip() else []
-        else:
-            logs = []
-    except (json.JSONDecodeError, IOError, OSError):
+        logs = _read_file_logs(n, needles)
+    except (IOError, OSError):
         logs = []
     
     return _filter_logs(logs, audit_id=audit_id, category=category, since=since, limit=limit)
@@ -307,17 +442,20 @@ def _filter_logs(
     if category:
         filtered = [log for log in filtered if log.get("category") == category]
     
-    # Filter by since timestamp
+    # Filter by since timestamp. Entries carry naive local ISO timestamps,
+    # which sort lexicographically, so since is normalized to the same form
+    # once and compared as a string
     if since:
         try:
             since_dt = datetime.fromisoformat(since.replace('Z', '+00:00'))
-            filtered = [
-                log for log in filtered
-                if datetime.fromisoformat(log.get("timestamp", "").replace('Z', '+00:00')) >= since_dt
-            ]
         except (ValueError, TypeError):
             # Invalid timestamp, skip filtering
-            pass
+            since_dt = None
+        if since_dt is not None:
+            if since_dt.tzinfo is not None:
+                since_dt = since_dt.astimezone().replace(tzinfo=None)
+            since_key = since_dt.isoformat()
+            filtered = [log for log in filtered if log.get("timestamp", "") >= since_key]
     
     # Apply limit
     if limit is not None and limit > 0:
@@ -328,22 +466,20 @@ def _filter_logs(
 
 def clear_logs(audit_id: Optional[str] = None) -> None:
     """
-    Clear all logs from Redis (preferred) or logs.json (fallback).
+    Clear all logs from Redis (preferred) or logs.jsonl (fallback).
     
     Args:
         audit_id: Optional audit ID to clear specific audit logs.
                  If None, clears all logs.
     """
     # Try Redis first
-    if REDIS_CLIENT_AVAILABLE and is_redis_available():
+    if _redis_ok():
         try:
             from redis_client import clear_logs as redis_clear_logs
             if redis_clear_logs(audit_id=audit_id):
                 # Also clear file if clearing all logs
                 if audit_id is None:
-                    with _log_lock:
-                        _ensure_log_file()
-                        _log_file.write_text("[]")
+                    _clear_log_file()
                 return
         except Exception:
             # Fall through to file-based clearing if Redis fails
@@ -352,13 +488,18 @@ def clear_logs(audit_id: Optional[str] = None) -> None:
     # Fallback to file-based clearing
     if audit_id is None:
         # Clear all logs
-        with _log_lock:
-            _ensure_log_file()
-            _log_file.write_text("[]")
+        _clear_log_file()
     else:
         # Remove logs for specific audit_id
         logs = get_logs()
         filtered_logs = [log for log in logs if log.get("auditId") != audit_id]
         with _log_lock:
-            _ensure_log_file()
-            _log_file.write_text(json.dumps(filtered_logs, indent=2))
+            with _open_locked_for_append():
+                _replace_log_file([_encode_entry(log) for log in filtered_logs])
+
+
+def _clear_log_file() -> None:
+    """Empty logs.jsonl."""
+    with _log_lock:
+        with _open_locked_for_append():
+            _replace_log_file([])
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """
-Migration script to migrate logs.json to Redis.
+Migration script to migrate logs.jsonl (or a legacy logs.json) to Redis.
 
-This script reads existing logs from logs.json and migrates them to Redis,
+This script reads existing logs from the log file and migrates them to Redis,
 preserving structure and timestamps. Logs are stored with audit_id grouping
 if available, otherwise in the global logs key.
 
@@ -34,10 +34,10 @@ except ImportError:
 
 def load_logs_from_file(logs_path: Path) -> List[Dict[str, Any]]:
     """
-    Load logs from logs.json file.
+    Load logs from a logs.jsonl (one entry per line) or legacy logs.json file.
     
     Args:
-        logs_path: Path to logs.json file
+        logs_path: Path to the logs file
         
     Returns:
         List of log entries
@@ -47,20 +47,22 @@ def load_logs_from_file(logs_path: Path) -> List[Dict[str, Any]]:
         return []
     
     try:
-        with open(logs_path, 'r') as f:
+        with open(logs_path, 'r', encoding='utf-8') as f:
             content = f.read().strip()
             if not content:
                 return []
+            if logs_path.suffix == ".jsonl":
+                return [json.loads(line) for line in content.splitlines() if line.strip()]
             logs = json.loads(content)
             if not isinstance(logs, list):
                 print(f"WARNING: logs.json does not contain an array, got {type(logs)}")
                 return []
             return logs
     except json.JSONDecodeError as e:
-        print(f"ERROR: Failed to parse logs.json: {e}")
+        print(f"ERROR: Failed to parse {logs_path.name}: {e}")
         return []
     except Exception as e:
-        print(f"ERROR: Failed to read logs.json: {e}")
+        print(f"ERROR: Failed to read {logs_path.name}: {e}")
         return []
 
 
@@ -122,7 +124,7 @@ def migrate_logs(logs: List[Dict[str, Any]], dry_run: bool = False) -> Dict[str,
 def main():
     """Main migration function."""
     parser = argparse.ArgumentParser(
-        description="Migrate logs.json to Redis",
+        description="Migrate logs.jsonl (or logs.json) to Redis",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -150,7 +152,7 @@ Examples:
         "--logs-file",
         type=str,
         default=None,
-        help="Path to logs.json file (default: ../logs.json)"
+        help="Path to logs file (default: ../logs.jsonl, or ../logs.json if absent)"
     )
     
     args = parser.parse_args()
@@ -170,7 +172,9 @@ Examples:
     if args.logs_file:
         logs_path = Path(args.logs_file)
     else:
-        logs_path = Path(__file__).parent.parent / "logs.json"
+        logs_path = Path(__file__).parent.parent / "logs.jsonl"
+        if not logs_path.exists():
+            logs_path = logs_path.with_suffix(".json")
     
     print(f"Reading logs from: {logs_path}")
     
@@ -38,6 +38,20 @@ MIDNIGHT_INDEXER = os.getenv("MIDNIGHT_INDEXER", "http://localhost:6300/graphql"
 MIDNIGHT_INDEXER_WS = os.getenv("MIDNIGHT_INDEXER_WS", "ws://localhost:6300/graphql/ws")
 MIDNIGHT_PROOF_EXPIRY_HOURS = int(os.getenv("MIDNIGHT_PROOF_EXPIRY_HOURS", "24"))
 
+# Upper bound on proofs verified at once, shared by all batch_verify calls
+# on the same event loop
+BATCH_VERIFY_CONCURRENCY = 16
+_verify_sem: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+
+def _get_verify_semaphore() -> asyncio.Semaphore:
+    """Return the batch_verify semaphore for the running loop, creating it on first use."""
+    global _verify_sem
+    loop = asyncio.get_running_loop()
+    if _verify_sem is None or _verify_sem[0] is not loop:
+        _verify_sem = (loop, asyncio.Semaphore(BATCH_VERIFY_CONCURRENCY))
+    return _verify_sem[1]
+
 
 class ProofVerificationResult:
     """Result of proof verification."""
@@ -178,7 +192,8 @@ async def verify_audit_proof(proof_id: str, expected_auditor_id: Optional[str] =
 async def batch_verify(proof_ids: List[str], expected_auditor_id: Optional[str] = None) -> List[ProofVerificationResult]:
     """
     Verify multiple proofs in parallel.
-    Optimized for gas efficiency by batching requests.
+    Optimized for gas efficiency by batching requests: duplicate IDs are
+    verified once, and at most BATCH_VERIFY_CONCURRENCY proofs are in flight.
     
     Args:
         proof_ids: List of proof IDs to verify
@@ -190,14 +205,23 @@ async def batch_verify(proof_ids: List[str], expected_auditor_id: Optional[str]
     try:
         log("ProofVerifier", f"Batch verifying {len(proof_ids)} proofs...", "🔍", "info")
         
-        # Create tasks for parallel verification
-        tasks = [verify_audit_proof(proof_id, expected_auditor_id) for proof_id in proof_ids]
+        semaphore = _get_verify_semaphore()
+        
+        async def _verify_one(proof_id: str) -> ProofVerificationResult:
+            async with semaphore:
+                return await verify_audit_proof(proof_id, expected_auditor_id)
+        
+        # Create tasks for parallel verification, one per distinct proof ID
+        unique_ids = list(dict.fromkeys(proof_ids))
+        tasks = [_verify_one(proof_id) for proof_id in unique_ids]
         
         # Execute in parallel with timeout
-        results = await asyncio.wait_for(
+        unique_results = await asyncio.wait_for(
             asyncio.gather(*tasks, return_exceptions=True),
             timeout=30.0  # 30 second timeout for batch
         )
+        by_id = dict(zip(unique_ids, unique_results))
+        results = [by_id[proof_id] for proof_id in proof_ids]
         
         # Convert exceptions to error results
         verification_results = []
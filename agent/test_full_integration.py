@@ -55,10 +55,10 @@ async def test_logger():
         log("Test", "Vulnerability found", "⚠️", "vulnerability", is_vulnerability=True)
         
         # Verify logs were written
-        log_file = Path("logs.json")
+        log_file = Path(__file__).parent.parent / "logs.jsonl"
         if log_file.exists():
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
+            with open(log_file, 'r', encoding='utf-8') as f:
+                logs = [json.loads(line) for line in f if line.strip()]
                 if len(logs) >= 3:
                     print("   ✅ Logger writes entries correctly")
                     print(f"   ✅ Found {len(logs)} log entries")
@@ -67,7 +67,7 @@ async def test_logger():
                     print(f"   ❌ Expected 3+ entries, found {len(logs)}")
                     return False
         else:
-            print("   ❌ logs.json not created")
+            print("   ❌ logs.jsonl not created")
             return False
     except Exception as e:
         print(f"   ❌ Logger test failed: {str(e)}")
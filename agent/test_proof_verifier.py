@@ -222,6 +222,27 @@ async def test_batch_verify_mixed_results(sample_proof_data):
         assert results[2].isValid is True
 
 
+@pytest.mark.asyncio
+async def test_batch_verify_deduplicates(sample_proof_data):
+    """Test that repeated proof IDs are verified once and results keep input order."""
+    proof_ids = ["proof1", "proof2", "proof1"]
+    
+    with patch('proof_verifier.verify_audit_proof', new_callable=AsyncMock) as mock_verify:
+        mock_verify.return_value = ProofVerificationResult(
+            isValid=True,
+            isHighSeverity=True,
+            auditorId="auditor1",
+            timestamp=datetime.now(),
+            proofData=sample_proof_data
+        )
+        
+        results = await batch_verify(proof_ids)
+        
+        assert len(results) == 3
+        assert mock_verify.call_count == 2
+        assert results[0] is results[2]
+
+
 @pytest.mark.asyncio
 async def test_batch_verify_timeout():
     """Test batch verification timeout handling."""
@@ -4,24 +4,42 @@ import fs from 'fs';
 import path from 'path';
 
 /**
- * Read logs from logs.json file
+ * Parse logs.jsonl content (one JSON entry per line), skipping corrupt lines
+ */
+function parseJsonLines(content: string): any[] {
+  const logs: any[] = [];
+  for (const line of content.split('\n')) {
+    if (!line.trim()) {
+      continue;
+    }
+    try {
+      logs.push(JSON.parse(line));
+    } catch {
+      // Skip partially written or corrupt lines
+    }
+  }
+  return logs;
+}
+
+/**
+ * Read logs from logs.jsonl, falling back to a legacy logs.json array
  */
 function readLogsFromFile(): LogEntry[] {
   try {
-    const logsPath = path.join(process.cwd(), 'logs.json');
-    
-    if (!fs.existsSync(logsPath)) {
-      // Return empty array if file doesn't exist
-      return [];
-    }
+    const linesPath = path.join(process.cwd(), 'logs.jsonl');
+    const legacyPath = path.join(process.cwd(), 'logs.json');
     
-    const content = fs.readFileSync(logsPath, 'utf-8');
-    if (!content.trim()) {
+    let logs: any[];
+    if (fs.existsSync(linesPath)) {
+      logs = parseJsonLines(fs.readFileSync(linesPath, 'utf-8'));
+    } else if (fs.existsSync(legacyPath)) {
+      const content = fs.readFileSync(legacyPath, 'utf-8');
+      logs = content.trim() ? JSON.parse(content) : [];
+    } else {
+      // Return empty array if no log file exists
       return [];
     }
     
-    const logs = JSON.parse(content);
-    
     // Ensure all logs have required fields and map to LogEntry format
     return logs.map((log: any) => ({
       timestamp: log.timestamp || new Date().toISOString(),
@@ -5,6 +5,7 @@ Run this script to start the development server.
 """
 
 import http.server
+import json
 import socketserver
 import os
 import sys
@@ -25,10 +26,25 @@ class CustomHandler(http.server.SimpleHTTPRequestHandler):
         super().end_headers()
     
     def do_GET(self):
-        # Handle logs.json - serve from project root
+        # Handle logs.json - served as an array built from logs.jsonl in the project root
         if self.path == '/logs.json' or self.path == '/logs.json/':
-            self.path = '/logs.json'
-            return super().do_GET()
+            lines_path = Path('logs.jsonl')
+            if not lines_path.exists():
+                self.path = '/logs.json'  # Legacy array file
+                return super().do_GET()
+            logs = []
+            for line in lines_path.read_text(encoding='utf-8').splitlines():
+                try:
+                    logs.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Skip partially written or blank lines
+            body = json.dumps(logs).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
         
         # Handle root and index.html - serve frontend/index.html
         if self.path == '/' or self.path == '/index.html':
@@ -53,7 +69,7 @@ if __name__ == "__main__":
     with socketserver.TCPServer(("", PORT), CustomHandler) as httpd:
         print(f"🚀 0xGuard UI server running at http://localhost:{PORT}")
         print(f"📁 Serving from: {project_root}")
-        print(f"📝 Make sure logs.json exists in the project root for live updates")
+        print(f"📝 Make sure logs.jsonl exists in the project root for live updates")
         print(f"🛑 Press Ctrl+C to stop the server")
         try:
             httpd.serve_forever()
@@ -6,7 +6,7 @@ set -e
 
 MIDNIGHT_DEVNET_URL="${MIDNIGHT_DEVNET_URL:-http://localhost:6300}"
 MIDNIGHT_API_URL="${MIDNIGHT_API_URL:-http://localhost:8100}"
-LOGS_FILE="${LOGS_FILE:-logs.json}"
+LOGS_FILE="${LOGS_FILE:-logs.jsonl}"
 
 echo "🔍 Midnight Network End-to-End Functionality Test"
 echo "=================================================="